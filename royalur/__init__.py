@@ -2,6 +2,9 @@
 This package contains the RoyalUr library.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .model import (
     Tile,
     PlayerType, PlayerState,
@@ -12,13 +15,57 @@ from .model import (
     GameSettings,
     GameMetadata,
 )
-from .rules import (
-    RuleSet, RuleSetProvider,
-    SimpleRuleSet, SimpleRuleSetProvider,
-)
-from .game import (
-    Game, GameBuilder,
-)
-from .lut import (
-    LutReader, Lut,
-)
+
+if TYPE_CHECKING:
+    from .rules import (
+        RuleSet, RuleSetProvider,
+        SimpleRuleSet, SimpleRuleSetProvider,
+    )
+    from .game import (
+        Game, GameBuilder,
+    )
+    from .lut import (
+        LutReader, Lut,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "RuleSet": ".rules",
+    "RuleSetProvider": ".rules",
+    "SimpleRuleSet": ".rules",
+    "SimpleRuleSetProvider": ".rules",
+    "Game": ".game",
+    "GameBuilder": ".game",
+    "LutReader": ".lut",
+    "Lut": ".lut",
+}
+"""
+The names exported by this package that are only imported when they
+are first accessed, so that importing the model does not also import
+the rules, games, and look-up tables.
+"""
+
+__all__ = [
+    "Tile",
+    "PlayerType", "PlayerState",
+    "PathPair", "PathType",
+    "BoardShape", "BoardType",
+    "Piece", "Move", "Board",
+    "Dice", "DiceType",
+    "GameSettings",
+    "GameMetadata",
+    *_LAZY_IMPORTS,
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
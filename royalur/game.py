@@ -1,6 +1,7 @@
 from .model import (
     GameMetadata,
     GameSettings,
+    check_starting_piece_count,
     DiceType,
     Dice, Roll,
     BoardShape,
@@ -23,22 +24,74 @@ from .rules import (
     MovedGameState,
     WinGameState,
 )
+from .rules.state import (
+    KIND_PLAYABLE,
+    KIND_WAITING_FOR_ROLL,
+    KIND_WAITING_FOR_MOVE,
+    KIND_ACTION,
+    KIND_ROLLED,
+    KIND_MOVED,
+    KIND_WIN,
+)
 from .rules.simple import SimpleRuleSetProvider
+from functools import lru_cache
 from typing import Iterable, Callable
 
 
+_PLAYABLE_KINDS = frozenset((
+    KIND_PLAYABLE, KIND_WAITING_FOR_ROLL, KIND_WAITING_FOR_MOVE,
+))
+_ACTION_KINDS = frozenset((
+    KIND_ACTION, KIND_ROLLED, KIND_MOVED,
+))
+
+
+@lru_cache(maxsize=None)
+def _create_preset_rules(preset: str, pawns: int = 7) -> RuleSet:
+    """
+    Creates the rule set for the preset game settings with the given
+    name. Rule sets are not modified by the games that use them, so
+    the rule set for each preset is created once and then shared.
+    """
+    if preset == "finkel":
+        settings = GameSettings.create_finkel(pawns)
+    elif preset == "masters":
+        settings = GameSettings.create_masters()
+    elif preset == "aseb":
+        settings = GameSettings.create_aseb()
+    else:
+        raise ValueError(f"Unknown preset: {preset}")
+
+    return SimpleRuleSetProvider().create(settings, GameMetadata())
+
+
 class Game:
     """
     A game of the Royal Game of Ur. Provides methods to
     allow the playing of games, and methods to support the
     retrieval of history about the moves that were made.
     """
-    __slots__ = ("_rules", "_dice", "_metadata", "_states")
+    __slots__ = (
+        "_rules", "_dice", "_metadata",
+        "_states", "_current_kind",
+        "_action_indices", "_moved_indices", "_states_snapshot",
+        "_current_wfr", "_current_wfm",
+        "_apply_roll", "_apply_move", "_paths",
+    )
 
     _rules: RuleSet
     _dice: Dice
     _metadata: GameMetadata
     _states: list[GameState]
+    _current_kind: int
+    _action_indices: list[int]
+    _moved_indices: list[int]
+    _states_snapshot: tuple[GameState, ...] | None
+    _current_wfr: WaitingForRollGameState | None
+    _current_wfm: WaitingForMoveGameState | None
+    _apply_roll: Callable[[WaitingForRollGameState, Roll], list[GameState]]
+    _apply_move: Callable[[WaitingForMoveGameState, Move], list[GameState]]
+    _paths: PathPair
 
     def __init__(
             self,
@@ -57,7 +110,15 @@ class Game:
         self._rules = rules
         self._metadata = metadata
         self._dice = rules.dice_factory()
+        self._apply_roll = rules.apply_roll
+        self._apply_move = rules.apply_move
+        self._paths = rules.paths
         self._states = []
+        self._action_indices = []
+        self._moved_indices = []
+        self._states_snapshot = None
+        self._current_wfr = None
+        self._current_wfm = None
 
         self.add_states(states)
 
@@ -68,29 +129,78 @@ class Game:
         if type(self) is not Game:
             raise RuntimeError(f"{type(self)} does not support copy")
 
-        new_game = Game(
-            self._rules, self._metadata.copy(), self._states
-        )
+        # The history is copied along with everything derived from it,
+        # instead of re-adding every state to a new game.
+        rules = self._rules
+        new_game = Game.__new__(Game)
+        new_game._rules = rules
+        new_game._metadata = self._metadata.copy()
+        new_game._dice = rules.dice_factory()
         new_game._dice.copy_from(self._dice)
+        new_game._apply_roll = self._apply_roll
+        new_game._apply_move = self._apply_move
+        new_game._paths = self._paths
+        new_game._states = self._states.copy()
+        new_game._action_indices = self._action_indices.copy()
+        new_game._moved_indices = self._moved_indices.copy()
+        new_game._states_snapshot = self._states_snapshot
+        new_game._current_kind = self._current_kind
+        new_game._current_wfr = self._current_wfr
+        new_game._current_wfm = self._current_wfm
         return new_game
 
     def add_states(self, states: Iterable[GameState]):
         """
         Adds all the given states to this game.
         """
-        seen = 0
-        for state in states:
-            seen += 1
-            self.add_state(state)
-
-        if seen == 0:
+        if not isinstance(states, (list, tuple)):
+            states = list(states)
+        if len(states) == 0:
             raise ValueError("There were no states to add")
 
+        # Subclasses that override add_state still see every state.
+        if type(self).add_state is not Game.add_state:
+            for state in states:
+                self.add_state(state)
+            return
+
+        index = len(self._states)
+        self._states.extend(states)
+        self._index_states(states, index)
+
     def add_state(self, state: GameState):
         """
         Adds the given state to this game.
         """
+        index = len(self._states)
         self._states.append(state)
+        self._index_states((state,), index)
+
+    def _index_states(
+            self,
+            states: list[GameState] | tuple[GameState, ...],
+            index: int
+    ):
+        """
+        Indexes the action and move states in the given non-empty run of
+        states, which have been appended to this game's states starting
+        at the given index, and updates the caches of the current state.
+        """
+        action_indices = self._action_indices
+        moved_indices = self._moved_indices
+        for state in states:
+            kind = state.KIND
+            if kind in _ACTION_KINDS:
+                action_indices.append(index)
+                if kind == KIND_MOVED:
+                    moved_indices.append(index)
+            index += 1
+
+        state = states[-1]
+        self._current_kind = kind
+        self._states_snapshot = None
+        self._current_wfr = state if kind == KIND_WAITING_FOR_ROLL else None
+        self._current_wfm = state if kind == KIND_WAITING_FOR_MOVE else None
 
     @property
     def rules(self) -> RuleSet:
@@ -114,11 +224,15 @@ class Game:
         return self._dice
 
     @property
-    def states(self) -> list[GameState]:
+    def states(self) -> tuple[GameState, ...]:
         """
         The states that have occurred so far in the game.
         """
-        return [*self._states]
+        snapshot = self._states_snapshot
+        if snapshot is None:
+            snapshot = tuple(self._states)
+            self._states_snapshot = snapshot
+        return snapshot
 
     def get_current_state(self) -> GameState:
         """
@@ -132,10 +246,8 @@ class Game:
         made so far in the game. The last state in the list represents
         the last action that was taken in this game.
         """
-        return [
-            state for state in self._states
-            if isinstance(state, ActionGameState)
-        ]
+        states = self._states
+        return [states[index] for index in self._action_indices]
 
     def get_landmark_states(self) -> list[ActionGameState]:
         """
@@ -144,48 +256,49 @@ class Game:
         landmark states as they contain all the information required
         to recreate everything that happened in the game so far.
         """
-        return [
-            state for index, state in enumerate(self._states)
-            if isinstance(state, MovedGameState)
-            or index == len(self._states) - 1
-        ]
+        states = self._states
+        landmarks = [states[index] for index in self._moved_indices]
+
+        # The current state may itself be the last move made.
+        if self._current_kind != KIND_MOVED:
+            landmarks.append(states[-1])
+        return landmarks
 
     def is_playable(self) -> bool:
         """
         Determines whether the game is currently in a playable state.
         """
-        return isinstance(self.get_current_state(), PlayableGameState)
+        return self._current_kind in _PLAYABLE_KINDS
 
     def is_waiting_for_roll(self) -> bool:
         """
         Determines whether the game is currently
         waiting for a roll from a player.
         """
-        return isinstance(self.get_current_state(), WaitingForRollGameState)
+        return self._current_kind == KIND_WAITING_FOR_ROLL
 
     def is_waiting_for_move(self) -> bool:
         """
         Determines whether the game is currently
         waiting for a move from a player.
         """
-        return isinstance(self.get_current_state(), WaitingForMoveGameState)
+        return self._current_kind == KIND_WAITING_FOR_MOVE
 
     def is_finished(self) -> bool:
         """
         Determines whether the game is currently in a finished state.
         """
-        return isinstance(self.get_current_state(), WinGameState)
+        return self._current_kind == KIND_WIN
 
     def get_current_playable_state(self) -> PlayableGameState:
         """
         Gets the current state of this game as a PlayableGameState.
         This will throw an error if the game is not in a playable state.
         """
-        state = self.get_current_state()
-        if not isinstance(state, PlayableGameState):
+        if self._current_kind not in _PLAYABLE_KINDS:
             raise RuntimeError("This game is not in a playable state")
 
-        return state
+        return self._states[-1]
 
     def get_current_waiting_for_roll_state(self) -> WaitingForRollGameState:
         """
@@ -193,8 +306,8 @@ class Game:
         of WaitingForRollGameState. This will throw an error
         if the game is not waiting for a roll from a player.
         """
-        state = self.get_current_state()
-        if not isinstance(state, WaitingForRollGameState):
+        state = self._current_wfr
+        if state is None:
             raise RuntimeError("This game is not in a waiting for roll state")
 
         return state
@@ -205,8 +318,8 @@ class Game:
         of WaitingForMoveGameState. This will throw an error
         if the game is not waiting for a  move from a player.
         """
-        state = self.get_current_state()
-        if not isinstance(state, WaitingForMoveGameState):
+        state = self._current_wfm
+        if state is None:
             raise RuntimeError("This game is not in a waiting for move state")
 
         return state
@@ -217,11 +330,10 @@ class Game:
         of WinGameState. This will throw an error if the
         game has not been won.
         """
-        state = self.get_current_state()
-        if not isinstance(state, WinGameState):
+        if self._current_kind != KIND_WIN:
             raise RuntimeError("This game is not in a win state")
 
-        return state
+        return self._states[-1]
 
     def roll_dice(self, value: Roll | int | None = None) -> Roll:
         """
@@ -229,28 +341,38 @@ class Game:
         game accordingly. If a value is supplied, then
         the roll will have that value.
         """
+        state = self._current_wfr
+        if state is None:
+            raise RuntimeError("This game is not in a waiting for roll state")
+
         if value is None or not isinstance(value, Roll):
             roll = self._dice.roll(value)
         else:
             roll = value
 
         # Update the state of the game after rolling.
-        state = self.get_current_waiting_for_roll_state()
-        self.add_states(self._rules.apply_roll(state, roll))
+        self.add_states(self._apply_roll(state, roll))
         return roll
 
     def find_available_moves(self) -> list[Move]:
         """
         Finds all moves that can be made from the current position.
         """
-        return self.get_current_waiting_for_move_state().available_moves
+        state = self._current_wfm
+        if state is None:
+            raise RuntimeError("This game is not in a waiting for move state")
+
+        return state.available_moves
 
     def _make_move(self, move: Move):
         """
         Applies a move.
         """
-        state = self.get_current_waiting_for_move_state()
-        self.add_states(self._rules.apply_move(state, move))
+        state = self._current_wfm
+        if state is None:
+            raise RuntimeError("This game is not in a waiting for move state")
+
+        self.add_states(self._apply_move(state, move))
 
     def make_move(self, move: Move | Piece | Tile):
         """
@@ -259,6 +381,7 @@ class Game:
         moves the given piece, or a piece from the given tile.
         If a move is provided, this does not check whether it is valid.
         """
+        # Moves are by far the most common argument, so they are checked first.
         if isinstance(move, Move):
             self._make_move(move)
             return
@@ -267,43 +390,65 @@ class Game:
         if isinstance(move, Piece):
             piece = move
             state = self.get_current_waiting_for_move_state()
-            for avail_move in state.available_moves:
+            avail_move = state.get_move_from_piece(piece)
+            if avail_move is None:
+                raise ValueError(f"The piece cannot be moved, {piece}")
 
-                if avail_move.has_source() \
-                        and avail_move.get_source_piece() == piece:
-
-                    self._make_move(avail_move)
-                    return
-
-            raise ValueError(f"The piece cannot be moved, {piece}")
+            self._make_move(avail_move)
+            return
 
         # Find the move for the given tile.
         if isinstance(move, Tile):
             tile = move
-            paths = self._rules.paths
             state = self.get_current_waiting_for_move_state()
-            for avail_move in state.available_moves:
-                if avail_move.get_source(paths) == tile:
-                    self._make_move(avail_move)
-                    return
+            avail_move = state.get_move_from_tile(tile, self._paths)
+            if avail_move is None:
+                raise ValueError(f"There is no available move from {tile}")
 
-            raise ValueError(f"There is no available move from {piece}")
+            self._make_move(avail_move)
+            return
 
         raise RuntimeError("move is not a Move, Piece, or Tile")
 
+    def rollout(
+            self,
+            policy: Callable[[WaitingForMoveGameState], Move]
+    ) -> PlayerType:
+        """
+        Plays out the rest of this game by rolling the dice and
+        making the moves chosen by the given policy, until a player
+        wins. The policy is given each state that is waiting for a
+        move, and must return one of its available moves. Returns
+        the player that won the game.
+        """
+        apply_roll = self._apply_roll
+        apply_move = self._apply_move
+        roll = self._dice.roll
+        states = self._states
+        while True:
+            kind = self._current_kind
+            state = states[-1]
+            if kind == KIND_WAITING_FOR_ROLL:
+                self.add_states(apply_roll(state, roll()))
+            elif kind == KIND_WAITING_FOR_MOVE:
+                self.add_states(apply_move(state, policy(state)))
+            elif kind == KIND_WIN:
+                return state.get_winner()
+            else:
+                raise RuntimeError("The game is not in a playable or won state")
+
     def make_move_introducing_piece(self):
         """
         Moves a new piece onto the board.
         """
         state = self.get_current_waiting_for_move_state()
-        for move in state.available_moves:
-            if move.is_introducing_piece():
-                self._make_move(move)
-                return
+        move = state.get_introducing_move()
+        if move is None:
+            raise ValueError(
+                "There is no available move to introduce a piece to the board"
+            )
 
-        raise ValueError(
-            "There is no available move to introduce a piece to the board"
-        )
+        self._make_move(move)
 
     def get_board(self) -> Board:
         """
@@ -340,11 +485,12 @@ class Game:
         Gets the player who can make the next interaction with the game,
         or the winner of the game if it is finished.
         """
-        state = self.get_current_state()
-        if isinstance(state, PlayableGameState):
+        kind = self._current_kind
+        state = self._states[-1]
+        if kind in _PLAYABLE_KINDS:
             return state.get_turn()
 
-        if isinstance(state, WinGameState):
+        if kind == KIND_WIN:
             return state.get_winner()
 
         raise RuntimeError("The game is not in a playable or won state")
@@ -419,7 +565,7 @@ class Game:
         tiles, the standard dice, and seven starting
         pieces per player.
         """
-        return Game.create(GameSettings.create_finkel(pawns))
+        return Game(_create_preset_rules("finkel", pawns))
 
     @staticmethod
     def create_masters():
@@ -430,7 +576,7 @@ class Game:
         tiles, the standard dice, and seven starting
         pieces per player.
         """
-        return Game.create(GameSettings.create_masters())
+        return Game(_create_preset_rules("masters"))
 
     @staticmethod
     def create_aseb():
@@ -439,7 +585,7 @@ class Game:
         the Aseb board shape, the Aseb paths, the standard
         dice, and five starting pieces per player.
         """
-        return Game.create(GameSettings.create_aseb())
+        return Game(_create_preset_rules("aseb"))
 
 
 class GameBuilder:
@@ -447,25 +593,76 @@ class GameBuilder:
     A builder to help in the creation of custom games
     of the Royal Game of Ur.
     """
-    __slots__ = ("_settings", "_rule_set_provider")
-
-    _settings: GameSettings
+    __slots__ = (
+        "_board_shape", "_paths", "_dice_factory",
+        "_starting_piece_count", "_safe_rosettes",
+        "_rosettes_grant_extra_rolls",
+        "_captures_grant_extra_rolls",
+        "_rule_set_provider", "_settings",
+    )
+
+    _board_shape: BoardShape
+    _paths: PathPair
+    _dice_factory: Callable[[], Dice]
+    _starting_piece_count: int
+    _safe_rosettes: bool
+    _rosettes_grant_extra_rolls: bool
+    _captures_grant_extra_rolls: bool
     _rule_set_provider: RuleSetProvider
+    _settings: GameSettings | None
 
     def __init__(
             self,
             settings: GameSettings,
             rule_set_provider: RuleSetProvider
     ):
-        self._settings = settings
+        self._board_shape = settings.board_shape
+        self._paths = settings.paths
+        self._dice_factory = settings.dice
+        self._starting_piece_count = settings.starting_piece_count
+        self._safe_rosettes = settings.safe_rosettes
+        self._rosettes_grant_extra_rolls = settings.rosettes_grant_extra_rolls
+        self._captures_grant_extra_rolls = settings.captures_grant_extra_rolls
         self._rule_set_provider = rule_set_provider
+        self._settings = settings
+
+    def _copy(self) -> 'GameBuilder':
+        """
+        Creates a copy of this game builder, without
+        constructing any intermediate game settings.
+        The settings of the copy are built when they
+        are first needed.
+        """
+        builder = GameBuilder.__new__(GameBuilder)
+        builder._board_shape = self._board_shape
+        builder._paths = self._paths
+        builder._dice_factory = self._dice_factory
+        builder._starting_piece_count = self._starting_piece_count
+        builder._safe_rosettes = self._safe_rosettes
+        builder._rosettes_grant_extra_rolls = self._rosettes_grant_extra_rolls
+        builder._captures_grant_extra_rolls = self._captures_grant_extra_rolls
+        builder._rule_set_provider = self._rule_set_provider
+        builder._settings = None
+        return builder
 
     @property
     def settings(self) -> GameSettings:
         """
         The settings of the game being built.
         """
-        return self._settings
+        settings = self._settings
+        if settings is None:
+            settings = GameSettings(
+                self._board_shape,
+                self._paths,
+                self._dice_factory,
+                self._starting_piece_count,
+                self._safe_rosettes,
+                self._rosettes_grant_extra_rolls,
+                self._captures_grant_extra_rolls,
+            )
+            self._settings = settings
+        return settings
 
     @property
     def rule_set_provider(self) -> RuleSetProvider:
@@ -478,7 +675,7 @@ class GameBuilder:
         """
         Create a copy of this game builder with new settings.
         """
-        return GameBuilder(settings, self.rule_set_provider)
+        return GameBuilder(settings, self._rule_set_provider)
 
     def finkel(self) -> 'GameBuilder':
         """
@@ -508,9 +705,12 @@ class GameBuilder:
         """
         Copies this game builder with the shape of the board updated.
         """
-        return self.replace_settings(
-            self._settings.with_board_shape(board_shape)
-        )
+        if isinstance(board_shape, BoardType):
+            board_shape = board_shape.create_board_shape()
+
+        builder = self._copy()
+        builder._board_shape = board_shape
+        return builder
 
     def paths(
             self,
@@ -520,7 +720,12 @@ class GameBuilder:
         Copies this game builder with the paths taken
         by each player updated.
         """
-        return self.replace_settings(self._settings.with_paths(paths))
+        if isinstance(paths, PathType):
+            paths = paths.create_path_pair()
+
+        builder = self._copy()
+        builder._paths = paths
+        return builder
 
     def dice(
             self,
@@ -530,7 +735,12 @@ class GameBuilder:
         Copies this game builder with the factory
         used to generate dice updated.
         """
-        return self.replace_settings(self._settings.with_dice(dice))
+        if isinstance(dice, DiceType):
+            dice = dice.dice_factory
+
+        builder = self._copy()
+        builder._dice_factory = dice
+        return builder
 
     def starting_piece_count(
             self,
@@ -540,9 +750,11 @@ class GameBuilder:
         Copies this game builder with the number of
         starting pieces of each player updated.
         """
-        return self.replace_settings(
-            self._settings.with_starting_piece_count(starting_piece_count)
-        )
+        check_starting_piece_count(starting_piece_count)
+
+        builder = self._copy()
+        builder._starting_piece_count = starting_piece_count
+        return builder
 
     def safe_rosettes(
             self,
@@ -552,9 +764,9 @@ class GameBuilder:
         Copies this game builder with whether rosettes are safe
         from capture set to the given value.
         """
-        return self.replace_settings(
-            self._settings.with_safe_rosettes(safe_rosettes)
-        )
+        builder = self._copy()
+        builder._safe_rosettes = safe_rosettes
+        return builder
 
     def rosettes_grant_extra_rolls(
             self,
@@ -564,11 +776,9 @@ class GameBuilder:
         Copies this game builder with whether landing on a rosette
         grants an additional roll set to the given value.
         """
-        return self.replace_settings(
-            self._settings.with_rosettes_grant_extra_rolls(
-                rosettes_grant_extra_rolls
-            )
-        )
+        builder = self._copy()
+        builder._rosettes_grant_extra_rolls = rosettes_grant_extra_rolls
+        return builder
 
     def captures_grant_extra_rolls(
             self,
@@ -578,17 +788,15 @@ class GameBuilder:
         Copies this game builder with whether capturing a piece
         grants an additional roll set to the given value.
         """
-        return self.replace_settings(
-            self._settings.with_captures_grant_extra_rolls(
-                captures_grant_extra_rolls
-            )
-        )
+        builder = self._copy()
+        builder._captures_grant_extra_rolls = captures_grant_extra_rolls
+        return builder
 
     def build_rules(self) -> RuleSet:
         """
         Generates a rule set to match the settings in this builder.
         """
-        return self._rule_set_provider.create(self._settings, GameMetadata())
+        return self._rule_set_provider.create(self.settings, GameMetadata())
 
     def build(self) -> Game:
         """
@@ -1,11 +1,71 @@
-from typing import List
+from array import array
+
+import numpy as np
 
 from royalur.model.player import PlayerType
 
 
+_MIDDLE_LANE_OCCUPANTS = (
+    (0, 0, 0),
+    (1, 0, 1),
+    (2, 1, 0),
+)
+"""
+The possible occupants of a tile in the middle lane, as tuples of the
+occupant code, the number of light pieces it uses, and the number of
+dark pieces it uses. An occupant of 1 is a dark piece, and 2 is light.
+"""
+
+_BOARD_WIDTH = 3
+_BOARD_HEIGHT = 8
+
+_MIDDLE_LANE_TILES = tuple(
+    (2 * iy, iy * _BOARD_WIDTH + 1) for iy in range(_BOARD_HEIGHT)
+)
+"""
+The bit shift and the board tile index of each tile in the middle lane.
+"""
+
+_SIDE_LANE_TILES = {
+    ix: tuple(iy * _BOARD_WIDTH + ix for iy in (0, 1, 2, 3, 6, 7))
+    for ix in (0, 2)
+}
+"""
+The board tile indices of the tiles in each side lane, by the x index
+of the lane, in the order of their bits in the encoding.
+"""
+
+_MIDDLE_LANE_INDICES = np.array(
+    [tile_index for _, tile_index in _MIDDLE_LANE_TILES], dtype=np.intp
+)
+_MIDDLE_LANE_SHIFTS = np.array(
+    [shift for shift, _ in _MIDDLE_LANE_TILES], dtype=np.uint32
+)
+_SIDE_LANE_INDICES = {
+    ix: np.array(tile_indices, dtype=np.intp)
+    for ix, tile_indices in _SIDE_LANE_TILES.items()
+}
+_SIDE_LANE_SHIFTS = np.arange(6, dtype=np.uint32)
+
+_DARK = PlayerType.DARK
+
+
+def _get_pieces(board) -> list:
+    """
+    Gets the pieces of the given board, which must have the standard shape.
+    """
+    if board.width != _BOARD_WIDTH or board.height != _BOARD_HEIGHT:
+        raise ValueError("Only boards with the standard shape can be encoded")
+
+    return board.pieces
+
+
 class SimpleGameStateEncoding:
     def __init__(self):
         self.middle_lane_compression = self.generate_middle_lane_compression()
+        self._middle_lane_compression_array = np.frombuffer(
+            self.middle_lane_compression, dtype=np.int16
+        )
 
         max_compressed = max(self.middle_lane_compression)
         bits = 1
@@ -14,8 +74,9 @@ class SimpleGameStateEncoding:
         if bits != 13:
             raise RuntimeError("Expected the middle lane to take 13 bits")
 
-    def generate_middle_lane_compression(self) -> List[int]:
-        middle_lane_compression = [-1] * 0xFFFF
+    def generate_middle_lane_compression(self) -> array:
+        # The compressed indices take 13 bits, so they fit in an int16.
+        middle_lane_compression = array("h", [-1]) * 0x10000
         states = []
         self.add_middle_lane_states(states, 0, 7, 7, 0)
 
@@ -26,18 +87,11 @@ class SimpleGameStateEncoding:
 
     def add_middle_lane_states(self, states, state, light_pieces, dark_pieces, index):
         next_index = index + 1
-        for occupant in range(3):
-            new_light_pieces = light_pieces
-            new_dark_pieces = dark_pieces
-
-            if occupant == 1:
-                new_dark_pieces -= 1
-                if new_dark_pieces < 0:
-                    continue
-            elif occupant == 2:
-                new_light_pieces -= 1
-                if new_light_pieces < 0:
-                    continue
+        for occupant, light_used, dark_used in _MIDDLE_LANE_OCCUPANTS:
+            new_light_pieces = light_pieces - light_used
+            new_dark_pieces = dark_pieces - dark_used
+            if new_light_pieces < 0 or new_dark_pieces < 0:
+                continue
 
             new_state = state | (occupant << (2 * index))
             if next_index == 8:
@@ -48,13 +102,12 @@ class SimpleGameStateEncoding:
                 )
 
     def encode_middle_lane(self, board):
+        pieces = _get_pieces(board)
         state = 0
-        for index in range(8):
-            piece = board._pieces[board._calc_tile_index(1, index)]
-            occupant = (
-                0 if piece is None else (1 if piece.owner == PlayerType.DARK else 2)
-            )
-            state |= occupant << (2 * index)
+        for shift, tile_index in _MIDDLE_LANE_TILES:
+            piece = pieces[tile_index]
+            if piece is not None:
+                state |= (1 if piece._owner is _DARK else 2) << shift
 
         compressed = self.middle_lane_compression[state]
         if compressed == -1:
@@ -63,19 +116,13 @@ class SimpleGameStateEncoding:
         return compressed
 
     def encode_side_lane(self, board, board_x):
+        pieces = _get_pieces(board)
         state = 0
-        base_bit_index = 0 if board_x == 0 else 3
-
-        for index in range(6):
-            board_y = index
-
-            if index >= 4:
-                board_y += 2
-                base_bit_index += 4
-
-            piece = board._pieces[board._calc_tile_index(board_x, board_y)]
-            occupant = 0 if piece is None else 1
-            state |= occupant << index
+        bit = 1
+        for tile_index in _SIDE_LANE_TILES[board_x]:
+            if pieces[tile_index] is not None:
+                state |= bit
+            bit <<= 1
 
         return state
 
@@ -85,6 +132,42 @@ class SimpleGameStateEncoding:
         middle_lane = self.encode_middle_lane(board)
         return right_lane | (middle_lane << 6) | (left_lane << 19)
 
+    def encode_boards(self, packed_boards: np.ndarray) -> np.ndarray:
+        """
+        Encodes many boards at once. Each row of packed_boards should
+        hold a board with the standard shape packed using Board.to_bytes.
+        Returns an array of the encodings of each board, which match
+        the results of encode_board.
+        """
+        packed_boards = np.asarray(packed_boards, dtype=np.uint8)
+        if packed_boards.ndim != 2 \
+                or packed_boards.shape[1] != _BOARD_WIDTH * _BOARD_HEIGHT:
+            raise ValueError("Only boards with the standard shape can be encoded")
+
+        # Dark pieces are encoded as 1, and light pieces as 2.
+        occupied = (packed_boards != 0).astype(np.uint32)
+        owners = (packed_boards >> 6).astype(np.uint32)
+        occupants = np.where(occupied != 0, 3 - owners, 0).astype(np.uint32)
+
+        middle_lanes = np.bitwise_or.reduce(
+            occupants[:, _MIDDLE_LANE_INDICES] << _MIDDLE_LANE_SHIFTS, axis=1
+        )
+        compressed = self._middle_lane_compression_array[middle_lanes]
+        if np.any(compressed < 0):
+            raise ValueError("Illegal board state!")
+
+        left_lanes = np.bitwise_or.reduce(
+            occupied[:, _SIDE_LANE_INDICES[0]] << _SIDE_LANE_SHIFTS, axis=1
+        )
+        right_lanes = np.bitwise_or.reduce(
+            occupied[:, _SIDE_LANE_INDICES[2]] << _SIDE_LANE_SHIFTS, axis=1
+        )
+        return (
+            right_lanes
+            | (compressed.astype(np.uint32) << 6)
+            | (left_lanes << 19)
+        ).astype(np.uint32)
+
     def encode_game_state(self, game_state):
         if not game_state.get_turn() == PlayerType.LIGHT:
             raise ValueError(
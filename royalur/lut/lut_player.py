@@ -1,7 +1,17 @@
+from collections import OrderedDict
+
 from royalur.game import Game
 from royalur.lut.board_encoder import SimpleGameStateEncoding
 from royalur.lut.reader import LutReader
 from royalur.model.player import PlayerType
+from royalur.rules.state import KIND_WIN
+
+
+_MAX_CACHED_DECISIONS = 1 << 20
+"""
+The maximum number of decisions that a LutAgent remembers. Once
+it is full, the least recently used decision is discarded.
+"""
 
 
 class LutAgent:
@@ -20,6 +30,7 @@ class LutAgent:
         lut = r.read()
         self.lut = lut
         self.encoding = SimpleGameStateEncoding()
+        self._decisions = OrderedDict()
 
     def play(self, game: Game):
         """
@@ -28,32 +39,74 @@ class LutAgent:
 
         :return: The move to play.
         """
-        highest_value = 0
-        highest_move = None
-        moves = game.find_available_moves()
-        for move in moves:
-            game_copy = game.copy()
-            game_copy.make_move(move)
-            game_state = game_copy.get_current_state()
-            inverted = False
-            if game_state.is_finished():
+        current_state = game.get_current_waiting_for_move_state()
+        moves = current_state.available_moves
+
+        # Positions that have been seen before reuse the earlier decision.
+        # The rules are part of the key, as they decide the available
+        # moves, and so the meaning of a remembered move index.
+        decisions = self._decisions
+        key = (
+            game.rules,
+            current_state.get_turn(),
+            self.encoding.encode_board(current_state.board),
+            current_state.light_player.piece_count,
+            current_state.dark_player.piece_count,
+            current_state.roll.value,
+        )
+        index = decisions.get(key)
+        if index is not None:
+            decisions.move_to_end(key)
+            return moves[index] if index >= 0 else None
+
+        index = self._choose_move_index(current_state, game.rules.apply_move)
+        decisions[key] = index
+        if len(decisions) > _MAX_CACHED_DECISIONS:
+            decisions.popitem(last=False)
+
+        return moves[index] if index >= 0 else None
+
+    def _choose_move_index(self, current_state, apply_move) -> int:
+        """
+        Finds the index of the available move with the highest value
+        in the look-up table, or -1 if no move has a positive value.
+        """
+        values = []
+        keys = []
+        lookups = []
+        # Moves are applied directly to the current state,
+        # so the game does not need to be copied to try them.
+        for index, move in enumerate(current_state.available_moves):
+            game_state = apply_move(current_state, move)[-1]
+            if game_state.KIND == KIND_WIN:
                 if game_state.get_winner() == PlayerType.DARK:
-                    value = 0
+                    values.append(0)
                 else:
-                    value = 65535
-            else:
-                if not game_state.is_finished() \
-                        and game_state.get_turn() != PlayerType.LIGHT:
-                    # invert the state because
-                    # the LUT is only for the light player
-                    game_state = game_state.copy_inverted()
-                    assert game_state.get_turn() == PlayerType.LIGHT
-                    inverted = True
-                state = self.encoding.encode_game_state(game_state)
-                value = self.lut.lookup(0, state)
-            if inverted:
-                value = 65535 - value
+                    values.append(65535)
+                continue
+
+            inverted = False
+            if game_state.get_turn() != PlayerType.LIGHT:
+                # invert the state because
+                # the LUT is only for the light player
+                game_state = game_state.copy_inverted()
+                assert game_state.get_turn() == PlayerType.LIGHT
+                inverted = True
+
+            # The value is filled in once all states have been looked up.
+            values.append(0)
+            keys.append(self.encoding.encode_game_state(game_state))
+            lookups.append((index, inverted))
+
+        if len(keys) > 0:
+            found = self.lut.lookup_batch(0, keys).tolist()
+            for (index, inverted), value in zip(lookups, found):
+                values[index] = 65535 - value if inverted else value
+
+        highest_value = 0
+        highest_index = -1
+        for index, value in enumerate(values):
             if value > highest_value:
                 highest_value = value
-                highest_move = move
-        return highest_move
+                highest_index = index
+        return highest_index
@@ -1,10 +1,72 @@
 import json
-from typing import Any, Dict
-import sys
+from functools import cached_property
+from itertools import accumulate
+import mmap
+import struct
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Union
 import time
 import numpy as np
 
 
+def _decode_native(
+        contents,
+        item_size: int,
+        count: int = -1,
+        offset: int = 0,
+) -> np.ndarray:
+    """
+    Decodes a buffer of big-endian unsigned integers into a read-only
+    array of integers in native byte order. The returned array is a
+    copy, so it does not keep the buffer alive.
+    """
+    big_endian = np.frombuffer(
+        contents, dtype=f">u{item_size}", count=count, offset=offset
+    )
+    native = big_endian.astype(big_endian.dtype.newbyteorder("="))
+    native.flags.writeable = False
+    return native
+
+
+_KEY_INDEX_KEYS_PER_BUCKET_BITS = 2
+"""
+The log2 of the approximate number of keys in each bucket of the index
+built over the keys of each map.
+"""
+
+
+def _build_key_index(keys: np.ndarray) -> tuple:
+    """
+    Builds an index over a sorted array of keys, so that a lookup only
+    has to search the few keys in one bucket. The range of the keys is
+    split into equally sized buckets, and the index records the position
+    of the first key in each bucket. Returns a tuple of the lowest key,
+    the highest key, the number of bits to shift a key by to get its
+    bucket, and the start of each bucket.
+    """
+    if len(keys) == 0:
+        # The range is empty, so no key will be looked up in the buckets.
+        return 1, 0, 0, None
+
+    lowest = int(keys[0])
+    highest = int(keys[-1])
+    shift = max(
+        0,
+        (highest - lowest).bit_length() - len(keys).bit_length()
+        + _KEY_INDEX_KEYS_PER_BUCKET_BITS,
+    )
+    bucket_count = ((highest - lowest) >> shift) + 1
+    bucket_keys = lowest + (np.arange(bucket_count + 1, dtype=np.int64) << shift)
+    starts = np.searchsorted(keys, bucket_keys).astype(np.uint32)
+    return lowest, highest, shift, memoryview(starts)
+
+
+_HASH_SAMPLE_SIZE = 64
+"""
+The approximate number of entries of a look-up table that are hashed.
+"""
+
+
 class Lut:
     """
     This class provides a way to look up values in a look-up table (LUT).
@@ -12,40 +74,76 @@ class Lut:
 
     def __init__(
         self,
-        keys: bytes,
-        values: bytes,
+        keys: Union[bytes, np.ndarray],
+        values: Union[bytes, np.ndarray],
         file_metadata: Dict[str, Any],
     ):
         """
         Create a new instance of the Lut class.
 
-        :param lut: The look-up table to use.
+        :param keys: The big-endian keys of every map, or an array
+            of the keys that has already been decoded into native
+            byte order.
+        :param values: The big-endian values of every map, or an
+            array of the values that has already been decoded into
+            native byte order.
+        :param file_metadata: The metadata of the look-up table.
         """
-        self._keys = keys
-        self._values = values
         self._metadata = file_metadata
         self._value_size = self._metadata["value_int_size_bytes"]
         self._key_size = self._metadata["key_int_size_bytes"]
         self._map_sizes = self._metadata["size_of_maps"]
-        self._len = int(len(self._keys) / self._key_size)
+        self._hash = None
+
+        # Only the decoded arrays are kept, so that the look-up table
+        # does not hold on to the buffers that it was read from.
+        if isinstance(keys, np.ndarray):
+            native_keys = keys
+        else:
+            native_keys = _decode_native(keys, self._key_size)
+        if isinstance(values, np.ndarray):
+            native_values = values
+        else:
+            native_values = _decode_native(values, self._value_size)
+        self._len = len(native_keys)
+        self._native_keys = native_keys
+        self._native_values = native_values
+
+        # The index of the first entry of each map, followed by the total.
+        self._map_starts = [0, *accumulate(self._map_sizes)]
+
+        # Views of the native keys and values of each map. The memoryviews
+        # are used for scalar lookups, as bisecting them avoids the dispatch
+        # overhead of calling into numpy for every key.
+        self._map_keys = []
+        self._map_values = []
+        self._map_key_views = []
+        self._map_value_views = []
+        self._map_key_indices = []
+        for map_index in range(len(self._map_sizes)):
+            map_start = self._map_starts[map_index]
+            map_end = self._map_starts[map_index + 1]
+            map_keys = native_keys[map_start:map_end]
+            map_values = native_values[map_start:map_end]
+            self._map_keys.append(map_keys)
+            self._map_values.append(map_values)
+            self._map_key_views.append(memoryview(map_keys))
+            self._map_value_views.append(memoryview(map_values))
+            self._map_key_indices.append(_build_key_index(map_keys))
 
     def keys_as_numpy(self, map_index: int = 0):
-        map_offset = self._get_map_offset(map_index, self._key_size)
-        return np.frombuffer(
-            self._keys,
-            dtype=f'>u{self._key_size}',
-            count=self._map_sizes[map_index],
-            offset=map_offset,
-        )
+        """
+        Get a read-only array of the keys of a map,
+        in native byte order.
+        """
+        return self._map_keys[map_index]
 
     def values_as_numpy(self, map_index: int = 0):
-        map_offset = self._get_map_offset(map_index, self._value_size)
-        return np.frombuffer(
-            self._values,
-            dtype=f'>u{self._value_size}',
-            count=self._map_sizes[map_index],
-            offset=map_offset,
-        )
+        """
+        Get a read-only array of the values of a map,
+        in native byte order.
+        """
+        return self._map_values[map_index]
 
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -53,7 +151,26 @@ class Lut:
 
         :return: A dictionary containing the metadata.
         """
-        return self._metadata
+        metadata = self._metadata
+        if "decoded_header" not in metadata and "raw_header" in metadata:
+            metadata["decoded_header"] = self.decoded_header
+
+        if "size_of_lut_python_bytes" not in metadata \
+                and "size_of_lut_file_bytes" in metadata:
+            python_bytes = self._native_keys.nbytes + self._native_values.nbytes
+            file_bytes = metadata["size_of_lut_file_bytes"]
+            metadata["size_of_lut_python_bytes"] = python_bytes
+            metadata["size_ratio"] = python_bytes / file_bytes if file_bytes else 1.0
+
+        return metadata
+
+    @cached_property
+    def decoded_header(self) -> Dict[str, Any]:
+        """
+        The JSON header of the look-up table file. The header is
+        only decoded the first time that it is accessed.
+        """
+        return json.loads(self._metadata["raw_header"])
 
     def lookup(self, map_index: int, key: int) -> int:
         """
@@ -62,10 +179,51 @@ class Lut:
         :param key: The key to look up.
         :return: The value associated with the key.
         """
-        index, _, _ = self._find_key_index(map_index, key)
+        index = self._find_key_index(map_index, key)
         if index is None:
             raise KeyError(f"Key {key} not found in look-up table")
-        return self._get_value_at_index(map_index, index)["value"]
+        return self._map_value_views[map_index][index]
+
+    def lookup_batch(
+            self,
+            map_index: int,
+            keys,
+            missing_value: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Look up the values of many keys in the look-up table at once.
+        This is much faster than calling lookup for each key when
+        evaluating many states, such as all the moves of a turn.
+
+        :param keys: The keys to look up.
+        :param missing_value: The value to use for keys that are not in
+            the look-up table, or None to raise a KeyError for them.
+        :return: An array of the values associated with each key.
+        """
+        map_keys = self._map_keys[map_index]
+        map_values = self._map_values[map_index]
+        # The keys are converted through a wider type first, as keys that
+        # do not fit in the key type would otherwise silently wrap around
+        # to the keys of other states.
+        keys = np.asarray(keys, dtype=np.int64)
+        value_dtype = map_values.dtype if missing_value is None else np.int64
+        if len(keys) == 0:
+            return np.empty(0, dtype=value_dtype)
+
+        in_range = (keys >= 0) & (keys < (1 << (8 * self._key_size)))
+        search_keys = np.where(in_range, keys, 0).astype(map_keys.dtype)
+        indices = np.searchsorted(map_keys, search_keys)
+        found = in_range & (indices < len(map_keys))
+        found[found] = map_keys[indices[found]] == search_keys[found]
+        if missing_value is None:
+            if not found.all():
+                missing = keys[np.argmin(found)]
+                raise KeyError(f"Key {missing} not found in look-up table")
+            return map_values[indices]
+
+        values = np.full(len(keys), missing_value, dtype=value_dtype)
+        values[found] = map_values[indices[found]]
+        return values
 
     def lookup_detailed(self, map_index: int, key: int):
         """
@@ -74,83 +232,104 @@ class Lut:
         :param key: The key to look up.
         :return: The value associated with the key.
         """
-        start_time = time.time()
-        index, key_lookup, steps = self._find_key_index(map_index, key)
+        start_time = time.perf_counter()
+        index, steps = self._find_key_index_counting_steps(map_index, key)
         if index is None:
             raise KeyError(f"Key {key} not found in look-up table")
+        key_lookup = self._get_key_at_index(map_index, index)
         lookup = self._get_value_at_index(map_index, index)
         return {
             "index_of_key": index,
             "key_binary_search_steps": steps,
             "value_lookup_details": lookup,
             "key_lookup_details": key_lookup,
-            "time_to_lookup_seconds": time.time() - start_time,
+            "time_to_lookup_seconds": time.perf_counter() - start_time,
         }
 
-    def _query_bytestring(
+    def _query_array(
             self,
             map_index: int,
             index_in_map: int,
-            collection: bytes,
+            collection: np.ndarray,
             item_size: int
-    ) -> int:
+    ) -> dict:
         map_offset = self._get_map_offset(map_index, item_size)
         return {
             "map_offset": map_offset,
-            "value": int.from_bytes(
-                collection[
-                    map_offset + index_in_map * item_size:
-                    map_offset + (index_in_map + 1) * item_size
-                ],
-                byteorder="big",
-                signed=False,
-            ),
+            "value": int(collection[index_in_map]),
             "index_of_value_in_bytestring":
                 map_offset + index_in_map * item_size,
             "item_size": item_size,
         }
 
-    def _get_value_at_index(self, map_index: int, index: int) -> int:
-        return self._query_bytestring(
+    def _get_value_at_index(self, map_index: int, index: int) -> dict:
+        return self._query_array(
             map_index,
             index,
-            self._values,
+            self._map_values[map_index],
             self._value_size,
         )
 
-    def _get_key_at_index(self, map_index: int, index: int) -> int:
-        return self._query_bytestring(
+    def _get_key_at_index(self, map_index: int, index: int) -> dict:
+        return self._query_array(
             map_index,
             index,
-            self._keys,
+            self._map_keys[map_index],
             self._key_size,
         )
 
     def _get_map_offset(self, map_index, item_size):
-        # compute map offset based on map index and map sizes
-        return sum(self._map_sizes[:map_index]) * item_size
+        return self._map_starts[map_index] * item_size
 
-    def _find_key_index(self, map_index: int, key: int) -> tuple:
+    def _find_key_index(self, map_index: int, key: int) -> Optional[int]:
+        """
+        Find the index of a key in the look-up table, or None if the key
+        is not present. The keys of each map are assumed to be sorted, so
+        the key is located using a binary search within its bucket of
+        the map's key index.
         """
-        Find the index of a key in the look-up table.
-        Uses binary search to find the index of the key in the keys array.
-        The keys are assumed to be sorted.
+        lowest, highest, shift, starts = self._map_key_indices[map_index]
+        if not lowest <= key <= highest:
+            return None
+
+        map_keys = self._map_key_views[map_index]
+        bucket = (key - lowest) >> shift
+        index = bisect_left(map_keys, key, starts[bucket], starts[bucket + 1])
+        if index < len(map_keys) and map_keys[index] == key:
+            return index
+        return None
+
+    def _find_key_index_counting_steps(
+            self,
+            map_index: int,
+            key: int
+    ) -> tuple[Optional[int], int]:
         """
-        low = 0
-        high = self._len - 1
+        Find the index of a key in the look-up table in the same way as
+        _find_key_index, but also count the steps taken by the binary
+        search within the key's bucket. Returns a tuple of the index of
+        the key, or None if it is not present, and the number of steps.
+        """
+        lowest, highest, shift, starts = self._map_key_indices[map_index]
+        if not lowest <= key <= highest:
+            return None, 0
+
+        map_keys = self._map_key_views[map_index]
+        bucket = (key - lowest) >> shift
+        low = starts[bucket]
+        high = starts[bucket + 1] - 1
         steps = 0
-
         while low <= high:
             mid = (low + high) // 2
-            mid_key = self._get_key_at_index(map_index, mid)
-            if mid_key["value"] == key:
-                return mid, mid_key, steps
-            elif mid_key["value"] < key:
+            mid_key = map_keys[mid]
+            if mid_key == key:
+                return mid, steps
+            elif mid_key < key:
                 low = mid + 1
             else:
                 high = mid - 1
             steps += 1
-        return None, None, steps  # If the target is not in the array
+        return None, steps
 
     def __len__(self) -> int:
         return self._len
@@ -162,26 +341,48 @@ class Lut:
     def __repr__(self) -> str:
         return f"Lut({self._len} entries)"
 
+    def __contains__(self, key: int) -> bool:
+        for map_index in range(len(self._map_sizes)):
+            if self._find_key_index(map_index, key) is not None:
+                return True
+        return False
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Lut):
             return False
-        return self._keys == other._keys \
-            and self._values == other._values \
-            and self._metadata == other._metadata
+        if self is other:
+            return True
+        # The metadata is not compared, as it includes details such as
+        # the time taken to read the file that vary between reads.
+        return self._map_sizes == other._map_sizes \
+            and np.array_equal(self._native_keys, other._native_keys) \
+            and np.array_equal(self._native_values, other._native_values)
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash((self._keys, self._values))
+        # Hashing every entry would take as long as reading the table, so
+        # the sizes of the maps are hashed with an evenly spaced sample of
+        # the keys and values, which always includes the last entry.
+        if self._hash is None:
+            step = max(1, self._len // _HASH_SAMPLE_SIZE)
+            sample = slice(self._len - 1, None, -step)
+            self._hash = hash((
+                tuple(self._map_sizes),
+                self._native_keys[sample].tobytes(),
+                self._native_values[sample].tobytes(),
+            ))
+        return self._hash
 
     def __bool__(self) -> bool:
-        return bool(self._keys)
+        return self._len > 0
 
     def __copy__(self) -> "Lut":
+        # The keys and values are never modified, so they can be shared.
         return Lut(
-            self._keys.copy(),
-            self._values.copy(),
+            self._native_keys,
+            self._native_values,
             self._metadata.copy(),
         )
 
@@ -203,76 +404,76 @@ class LutReader:
         """
         self._file_path = file_path
 
-    def _from_bytes(self, value: bytes) -> int:
-        return int.from_bytes(value, byteorder="big", signed=True)
-
     def read(self) -> Lut:
         """
         Read the look-up table from the file.
 
         :return: A dictionary containing the look-up table.
         """
-        start_time = time.time()
-        with open(self._file_path, "rb") as file:
-            binary_contents = file.read()
-
-        # first 3 bytes are magic number
-        magic_number = binary_contents[:3]
-        if magic_number != b"RGU":
-            raise ValueError("Invalid magic number")
-        # then, the next byte is the version number
-        version = binary_contents[3]
-        if version != 0:
-            raise ValueError("Only version 0 is implemented")
-        # then, the next 4 bytes are the number of entries in the json header
-        header_length = self._from_bytes(binary_contents[4:8])
-        # then, the next header_length bytes are the json header
-        # and is utf-8 encoded
-        header_end = 8 + header_length
-        json_header = binary_contents[8:header_end].decode("utf-8")
-
-        # the next 4 bytes are for the number of maps
-        number_of_maps = self._from_bytes(binary_contents[
-            header_end:
-            header_end + 4
-        ])
-        start_of_maps = header_end + 4
-        size_of_maps = []
-        for i in range(number_of_maps):
-            size_of_maps.append(self._from_bytes(binary_contents[
-                start_of_maps + 4 * i:
-                start_of_maps + 4 * (i + 1)
-            ]))
-        sum_of_size_of_maps = sum(size_of_maps)
-
-        # then, the lut keys
-        lut_start = start_of_maps + 4 * number_of_maps
-        lut_keys_end = lut_start + \
-            LutReader.key_size * \
-            sum_of_size_of_maps
-        lut_keys_bytes = binary_contents[lut_start:lut_keys_end]
-
-        # and the lut values
-        lut_values_start = lut_keys_end
-        lut_values_end = lut_values_start + \
-            LutReader.value_size * \
-            sum_of_size_of_maps
-        lut_values_bytes = binary_contents[lut_values_start:lut_values_end]
-
-        time_to_read = time.time() - start_time
+        start_time = time.perf_counter()
+        # The file is mapped rather than read, so that the keys and values
+        # are only copied once, when they are decoded into native arrays.
+        # The mapping is closed once they have been decoded.
+        with open(self._file_path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as binary_contents:
+            # first 3 bytes are magic number
+            magic_number = binary_contents[:3]
+            if magic_number != b"RGU":
+                raise ValueError("Invalid magic number")
+            # then, the next byte is the version number
+            version = binary_contents[3]
+            if version != 0:
+                raise ValueError("Only version 0 is implemented")
+            # then, the next 4 bytes are the number of entries in the json header
+            (header_length,) = struct.unpack_from(">i", binary_contents, 4)
+            # then, the next header_length bytes are the json header
+            # and is utf-8 encoded
+            header_end = 8 + header_length
+            json_header = binary_contents[8:header_end].decode("utf-8")
+
+            # the next 4 bytes are for the number of maps
+            (number_of_maps,) = struct.unpack_from(
+                ">i", binary_contents, header_end
+            )
+            # followed by the size of each map
+            start_of_maps = header_end + 4
+            size_of_maps = list(struct.unpack_from(
+                f">{number_of_maps}i", binary_contents, start_of_maps
+            ))
+            sum_of_size_of_maps = sum(size_of_maps)
+
+            # then, the lut keys, followed by the lut values. They are
+            # swapped into native byte order once, so that lookups do
+            # not have to convert them on every probe.
+            lut_start = start_of_maps + 4 * number_of_maps
+            lut_keys = _decode_native(
+                binary_contents,
+                LutReader.key_size,
+                count=sum_of_size_of_maps,
+                offset=lut_start,
+            )
+            lut_values_start = lut_start + \
+                LutReader.key_size * \
+                sum_of_size_of_maps
+            lut_values = _decode_native(
+                binary_contents,
+                LutReader.value_size,
+                count=sum_of_size_of_maps,
+                offset=lut_values_start,
+            )
+
+        time_to_read = time.perf_counter() - start_time
 
         size_of_lut_in_file = sum_of_size_of_maps * (
             LutReader.key_size + LutReader.value_size
         )
-        size_of_lut_bytes = sys.getsizeof(lut_keys_bytes) + \
-            sys.getsizeof(lut_values_bytes)
 
         return Lut(
-            lut_keys_bytes,
-            lut_values_bytes,
+            lut_keys,
+            lut_values,
             {
                 "raw_header": json_header,
-                "decoded_header": json.loads(json_header),
                 "version": version,
                 "key_int_size_bytes": LutReader.key_size,
                 "value_int_size_bytes": LutReader.value_size,
@@ -281,8 +482,6 @@ class LutReader:
                 "size_of_maps": size_of_maps,
                 "time_to_read_seconds": time_to_read,
                 "size_of_lut_file_bytes": size_of_lut_in_file,
-                "size_of_lut_python_bytes": size_of_lut_bytes,
-                "size_ratio": size_of_lut_bytes / size_of_lut_in_file,
                 "path": self._file_path,
                 "index_of_first_key_in_file": lut_start,
                 "index_of_first_value_in_file": lut_values_start,
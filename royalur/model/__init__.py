@@ -20,5 +20,5 @@ from .dice import (
     Roll, Dice, DiceType,
     BinaryDice, BinaryDice0AsMax,
 )
-from .settings import GameSettings
+from .settings import GameSettings, check_starting_piece_count
 from .metadata import GameMetadata
@@ -3,6 +3,48 @@ from .player import PlayerType
 from .shape import BoardShape
 from .path import PathPair
 from typing import Optional, Union
+import random
+import numpy as np
+
+
+_PACKED_OWNER_SHIFT = 6
+_PACKED_PATH_INDEX_MASK = (1 << _PACKED_OWNER_SHIFT) - 1
+_PACKED_OWNERS = {player.index: player for player in PlayerType}
+
+_ZOBRIST_SEED = 0xA17C5
+_zobrist_random = random.Random(_ZOBRIST_SEED)
+_zobrist_keys: list[tuple[int, ...]] = []
+_zobrist_table: np.ndarray = np.zeros((0, 256), dtype=np.uint64)
+
+
+def get_zobrist_keys(tile_count: int) -> list[tuple[int, ...]]:
+    """
+    Gets the random keys used for the Zobrist hashing of boards with
+    at least the given number of tiles. The keys are indexed by tile
+    index and then by packed piece. The key for an empty tile is zero,
+    so the hash of a board is the XOR of the keys of its pieces.
+    """
+    while len(_zobrist_keys) < tile_count:
+        _zobrist_keys.append((0, *[
+            _zobrist_random.getrandbits(64) for _ in range(255)
+        ]))
+
+    return _zobrist_keys
+
+
+def get_zobrist_table(tile_count: int) -> np.ndarray:
+    """
+    Gets the keys from get_zobrist_keys as an array of unsigned
+    64-bit integers, with one row per tile and one column per
+    packed piece. The array may contain more than tile_count rows.
+    """
+    global _zobrist_table
+    if len(_zobrist_table) < tile_count:
+        _zobrist_table = np.array(
+            get_zobrist_keys(tile_count), dtype=np.uint64
+        )
+
+    return _zobrist_table
 
 
 class Piece:
@@ -10,10 +52,11 @@ class Piece:
     A piece on a board.
     """
 
-    __slots__ = ("_owner", "_path_index")
+    __slots__ = ("_owner", "_path_index", "_hash")
 
     _owner: PlayerType
     _path_index: int
+    _hash: int
 
     def __init__(self, owner: PlayerType, path_index: int):
         """
@@ -23,16 +66,21 @@ class Piece:
             owner (PlayerType): The player that owns this piece.
             path_index (int):
                 The index of the piece on its owner's path.
-                Must be non-negative.
+                Must be non-negative, and at most 63 so that
+                the piece can be packed into a single byte.
 
         Raises:
-            ValueError: If the provided path_index is negative.
+            ValueError: If the provided path_index is negative,
+                or too large to pack.
         """
         if path_index < 0:
             raise ValueError(f"The path index cannot be negative: {path_index}")
+        if path_index > _PACKED_PATH_INDEX_MASK:
+            raise ValueError(f"The path index is too large to pack: {path_index}")
 
         self._owner = owner
         self._path_index = path_index
+        self._hash = hash((owner, path_index))
 
     @property
     def owner(self) -> PlayerType:
@@ -49,13 +97,39 @@ class Piece:
         return self._path_index
 
     def __hash__(self) -> int:
-        return hash((self._owner, self._path_index))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        if type(other) is not type(self):
-            return False
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (
+            self._hash == other._hash
+            and self._owner == other._owner
+            and self._path_index == other._path_index
+        )
+
+    def pack(self) -> int:
+        """
+        Packs this piece into a single byte, with the owner stored in
+        the upper two bits and the path index in the lower six bits.
+        A packed value of zero is used to represent an empty tile.
+        """
+        return (self._owner.index << _PACKED_OWNER_SHIFT) | self._path_index
+
+    @staticmethod
+    def unpack(packed: int) -> Optional["Piece"]:
+        """
+        Unpacks a piece that was packed using pack. Returns None
+        if the packed value represents an empty tile.
+        """
+        if packed == 0:
+            return None
 
-        return self._owner == other._owner and self._path_index == other._path_index
+        owner = _PACKED_OWNERS[packed >> _PACKED_OWNER_SHIFT]
+        return Piece(owner, packed & _PACKED_PATH_INDEX_MASK)
 
     @staticmethod
     def to_char(piece: Optional["Piece"]) -> str:
@@ -71,12 +145,16 @@ class Board:
     Stores the placement of pieces on the tiles of a Royal Game of Ur board.
     """
 
-    __slots__ = ("_shape", "_width", "_height", "_pieces")
+    __slots__ = (
+        "_shape", "_width", "_height", "_pieces", "_packed", "_zobrist_hash",
+    )
 
     _shape: BoardShape
     _width: int
     _height: int
     _pieces: list[Optional[Piece]]
+    _packed: bytearray
+    _zobrist_hash: int
 
     def __init__(
         self, board_or_shape: Union[BoardShape, "Board"], invert: bool = False
@@ -111,11 +189,47 @@ class Board:
                         if ix == 2:
                             new_pieces.append(self._pieces[0 + iy * self._width])
                 self._pieces = new_pieces
+                self._packed = bytearray([
+                    0 if piece is None else piece.pack()
+                    for piece in new_pieces
+                ])
+                self._zobrist_hash = self._calc_zobrist_hash()
 
             else:
                 self._pieces = [*board_or_shape._pieces]
+                self._packed = board_or_shape._packed.copy()
+                self._zobrist_hash = board_or_shape._zobrist_hash
         else:
-            self._pieces = [None for _ in range(self._width * self._height)]
+            tile_count = self._width * self._height
+            self._pieces = [None for _ in range(tile_count)]
+            self._packed = bytearray(tile_count)
+            self._zobrist_hash = 0
+
+    def _calc_zobrist_hash(self) -> int:
+        """
+        Calculates the Zobrist hash of this board from scratch.
+        """
+        keys = get_zobrist_keys(len(self._packed))
+        zobrist_hash = 0
+        for index, packed in enumerate(self._packed):
+            zobrist_hash ^= keys[index][packed]
+
+        return zobrist_hash
+
+    def _set_by_index(self, index: int, piece: Optional[Piece]) -> Optional[Piece]:
+        """
+        Sets the piece at the given index into the 1d array of pieces,
+        and incrementally updates the packed pieces and Zobrist hash
+        of this board.
+        """
+        packed = 0 if piece is None else piece.pack()
+        previous = self._pieces[index]
+        self._pieces[index] = piece
+
+        keys = get_zobrist_keys(index + 1)[index]
+        self._zobrist_hash ^= keys[self._packed[index]] ^ keys[packed]
+        self._packed[index] = packed
+        return previous
 
     def copy(self, invert: bool = False) -> "Board":
         """
@@ -154,6 +268,15 @@ class Board:
         """
         return self._height
 
+    @property
+    def pieces(self) -> list[Optional[Piece]]:
+        """
+        The piece on each tile of this board, or None for empty tiles,
+        indexed by iy * width + ix. This is the board's own list, so it
+        reflects later changes to the board and must not be modified.
+        """
+        return self._pieces
+
     def contains(self, tile: Tile) -> bool:
         """
         Determines whether the given tile falls
@@ -201,9 +324,7 @@ class Board:
             raise ValueError(f"There is no tile at {tile}")
 
         index = self._calc_tile_index(tile.ix, tile.iy)
-        previous = self._pieces[index]
-        self._pieces[index] = piece
-        return previous
+        return self._set_by_index(index, piece)
 
     def set_by_indices(
         self, ix: int, iy: int, piece: Optional[Piece]
@@ -218,9 +339,7 @@ class Board:
             raise ValueError(f"There is no tile at the indices ({ix}, {iy})")
 
         index = self._calc_tile_index(ix, iy)
-        previous = self._pieces[index]
-        self._pieces[index] = piece
-        return previous
+        return self._set_by_index(index, piece)
 
     def clear(self):
         """
@@ -229,6 +348,9 @@ class Board:
         for index in range(len(self._pieces)):
             self._pieces[index] = None
 
+        self._packed[:] = bytes(len(self._packed))
+        self._zobrist_hash = 0
+
     def count_pieces(self, player: PlayerType) -> int:
         """
         Counts the number of pieces that are on the board
@@ -241,12 +363,46 @@ class Board:
 
         return piece_count
 
+    def to_bytes(self) -> bytes:
+        """
+        Packs the pieces on this board into one byte per tile, in the
+        same order as they are stored in this board. Empty tiles are
+        represented by zero, and pieces are packed using Piece.pack.
+        """
+        return bytes(self._packed)
+
     def __eq__(self, other: object) -> bool:
         if type(other) is not type(self):
             return False
 
         return self._shape == other._shape and self._pieces == other._pieces
 
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        The Zobrist hash of the pieces on this board, which is
+        updated incrementally as pieces are moved.
+        """
+        return self._zobrist_hash
+
+    # Boards are mutable, so they cannot be used as keys in sets or dicts.
+    # The zobrist_hash of a board may be used to key its positions instead.
+    __hash__ = None
+
+    @staticmethod
+    def hash_batch(packed_boards: np.ndarray) -> np.ndarray:
+        """
+        Calculates the Zobrist hashes of many boards at once. Each row
+        of packed_boards should hold a board packed using to_bytes.
+        Returns an array of the Zobrist hashes of each board, which
+        match the zobrist_hash of the boards that were packed.
+        """
+        packed_boards = np.asarray(packed_boards, dtype=np.uint8)
+        tile_count = packed_boards.shape[1]
+        table = get_zobrist_table(tile_count)
+        keys = table[np.arange(tile_count), packed_boards]
+        return np.bitwise_xor.reduce(keys, axis=1)
+
     def to_string(
         self, column_delimiter: str = "\n", include_off_board_tiles: bool = True
     ):
@@ -273,9 +429,51 @@ class Board:
         return self.to_string()
 
 
+def _get_move_error(code: int) -> Optional[str]:
+    """
+    Gets the error for a move constructed with the combination of
+    missing values given by the bit flags in code, or None if the
+    combination is valid. The flags are, from the lowest bit, whether
+    the source, source piece, destination, destination piece, and
+    captured piece are None.
+    """
+    no_source = (code & 1) != 0
+    no_source_piece = (code & 2) != 0
+    no_dest = (code & 4) != 0
+    no_dest_piece = (code & 8) != 0
+    no_captured_piece = (code & 16) != 0
+
+    if no_source != no_source_piece:
+        return "source and source_piece must either be both null, or both non-null"
+    if no_dest != no_dest_piece:
+        return "dest and dest_piece must either be both null, or both non-null"
+    if no_dest and not no_captured_piece:
+        return "Moves without a destination cannot have captured a piece"
+
+    return None
+
+
+_MOVE_ERRORS = tuple(_get_move_error(code) for code in range(32))
+
+_MOVE_HASH_DEST_SHIFT = 20
+"""
+The shift of the packed destination tile within the hash of a move.
+The packed source tile is stored in the bits below it.
+"""
+
+_MOVE_HASH_CAPTURE_BIT = 1 << 40
+"""
+The bit of the hash of a move that is set if the move captures a piece.
+"""
+
+
 class Move:
     """
-    A move that can be made on a board.
+    A move that can be made on a board. The source and source piece
+    of a move are either both set or both None, and likewise for the
+    destination and destination piece. Code that has checked one of
+    a pair can therefore read the other directly, rather than
+    through its checked getter.
     """
 
     __slots__ = (
@@ -285,6 +483,9 @@ class Move:
         "_dest",
         "_dest_piece",
         "_captured_piece",
+        "_key",
+        "_hash",
+        "_description",
     )
 
     _player: PlayerType
@@ -293,6 +494,9 @@ class Move:
     _dest: Optional[Tile]
     _dest_piece: Optional[Piece]
     _captured_piece: Optional[Piece]
+    _key: tuple
+    _hash: int
+    _description: Optional[str]
 
     def __init__(
         self,
@@ -303,18 +507,15 @@ class Move:
         dest_piece: Optional[Piece],
         captured_piece: Optional[Piece],
     ):
-        if (source is None) != (source_piece is None):
-            raise ValueError(
-                "source and source_piece must either " "be both null, or both non-null"
-            )
-        if (dest is None) != (dest_piece is None):
-            raise ValueError(
-                "dest and dest_piece must either be both null, " "or both non-null"
-            )
-        if dest is None and captured_piece is not None:
-            raise ValueError(
-                "Moves without a destination " "cannot have captured a piece"
-            )
+        error = _MOVE_ERRORS[
+            (source is None)
+            | (source_piece is None) << 1
+            | (dest is None) << 2
+            | (dest_piece is None) << 3
+            | (captured_piece is None) << 4
+        ]
+        if error is not None:
+            raise ValueError(error)
 
         self._player = player
         self._source = source
@@ -322,6 +523,17 @@ class Move:
         self._dest = dest
         self._dest_piece = dest_piece
         self._captured_piece = captured_piece
+        self._key = (source, source_piece, dest, dest_piece, captured_piece)
+
+        # Moves are hashed by their packed source and destination tiles,
+        # and whether they capture, which avoids hashing the pieces.
+        packed = 0 if source is None else source._key
+        if dest is not None:
+            packed |= dest._key << _MOVE_HASH_DEST_SHIFT
+            if captured_piece is not None:
+                packed |= _MOVE_HASH_CAPTURE_BIT
+        self._hash = packed
+        self._description = None
 
     @property
     def player(self) -> PlayerType:
@@ -474,55 +686,43 @@ class Move:
         """
         Apply this move to update the given board.
         """
-        if self.source is not None:
-            board.set(self.source, None)
-        if self.dest is not None:
-            board.set(self.dest, self.dest_piece)
+        if self._source is not None:
+            board.set(self._source, None)
+        if self._dest is not None:
+            board.set(self._dest, self._dest_piece)
 
     def describe(self) -> str:
         """
         Generates an English description of this move.
         """
-        scoring = self.is_scoring_piece()
-        introducing = self.is_introducing_piece()
+        if self._description is None:
+            self._description = self._generate_description()
 
-        if scoring and introducing:
-            return "Introduce and score a piece"
+        return self._description
 
-        if scoring:
-            return f"Score a piece from {self.get_source()}"
+    def _generate_description(self) -> str:
+        """
+        Generates the description of this move that is cached by describe.
+        """
+        if self._dest is None:
+            if self._source is None:
+                return "Introduce and score a piece"
 
-        builder = []
-        if introducing:
-            builder.append("Introduce a piece to ")
-        else:
-            builder.append(f"Move {self.get_source()} to ")
+            return f"Score a piece from {self._source}"
 
-        if self.is_capture():
-            builder.append("capture ")
+        capture = "capture " if self._captured_piece is not None else ""
+        if self._source is None:
+            return f"Introduce a piece to {capture}{self._dest}"
 
-        builder.append(str(self.get_dest()))
-        return "".join(builder)
+        return f"Move {self._source} to {capture}{self._dest}"
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self._source,
-                self._source_piece,
-                self._dest,
-                self._dest_piece,
-                self._captured_piece,
-            )
-        )
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        if type(other) is not type(self):
-            return False
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-        return (
-            self._source == other._source
-            and self._source_piece == other._source_piece
-            and self._dest == other._dest
-            and self._dest_piece == other._dest_piece
-            and self._captured_piece == other._captured_piece
-        )
+        return self._hash == other._hash and self._key == other._key
@@ -1,8 +1,25 @@
+import bisect
+import functools
+import itertools
+import math
 import random
+import numpy as np
 from enum import Enum
 from abc import ABC, abstractmethod
-from overrides import overrides
-from typing import Callable
+from typing import Callable, Sequence
+
+
+_CDF_LINEAR_SCAN_MAX_DIE = 6
+"""
+The maximum number of die for which sampling from the cumulative
+roll probabilities uses a linear scan rather than a binary search.
+"""
+
+_ROLL_TABLE_MAX_DIE = 8
+"""
+The maximum number of die for which binary dice precompute a table
+that maps every combination of random bits to the value of the roll.
+"""
 
 
 class Roll:
@@ -66,7 +83,7 @@ class Dice(ABC):
         pass
 
     @abstractmethod
-    def get_roll_probabilities(self) -> list[float]:
+    def get_roll_probabilities(self) -> Sequence[float]:
         """
         Gets the probability of rolling each value of
         the dice, where the index into the returned
@@ -113,22 +130,50 @@ class BinaryDice(Dice):
     """
     Rolls a number of binary die and counts the result.
     """
-    __slots__ = ("_num_die", "_roll_probabilities")
+    __slots__ = (
+        "_num_die", "_roll_probabilities", "_roll_cdf",
+        "_rolls", "_roll_table", "_batch_rng",
+    )
 
     _num_die: int
-    _roll_probabilities: list[float]
+    _roll_probabilities: tuple[float, ...]
+    _roll_cdf: tuple[float, ...]
+    _rolls: tuple[Roll, ...]
+    _roll_table: bytes | None
+    _batch_rng: np.random.Generator | None
 
     def __init__(self, name: str, num_die: int):
         super().__init__(name)
         self._num_die = num_die
-        self._roll_probabilities = []
 
         # Binomial Distribution
-        baseProb = 0.5 ** num_die
-        nChooseK = 1
-        for roll in range(0, num_die + 1):
-            self._roll_probabilities.append(baseProb * nChooseK)
-            nChooseK = nChooseK * (num_die - roll) // (roll + 1)
+        base_probability = 0.5 ** num_die
+        self._roll_probabilities = tuple([
+            math.comb(num_die, roll) * base_probability
+            for roll in range(num_die + 1)
+        ])
+
+        self._update_roll_cdf()
+
+        # Rolls are immutable, so they can be shared.
+        self._rolls = tuple(Roll(value) for value in range(num_die + 1))
+
+        # Each random bit represents the roll of a single D2 dice.
+        if num_die <= _ROLL_TABLE_MAX_DIE:
+            self._roll_table = bytes([
+                bits.bit_count() for bits in range(1 << num_die)
+            ])
+        else:
+            self._roll_table = None
+
+        self._batch_rng = None
+
+    def _update_roll_cdf(self):
+        """
+        Recalculates the cumulative roll probabilities
+        from the probability of each roll.
+        """
+        self._roll_cdf = tuple(itertools.accumulate(self._roll_probabilities))
 
     @property
     def num_die(self) -> int:
@@ -137,30 +182,67 @@ class BinaryDice(Dice):
         """
         return self._num_die
 
-    @overrides
     def get_max_roll_value(self) -> int:
         return self._num_die
 
-    @overrides
-    def get_roll_probabilities(self) -> list[float]:
+    def get_roll_probabilities(self) -> tuple[float, ...]:
         return self._roll_probabilities
 
-    @overrides
     def roll_value(self) -> int:
-        value = 0
-        for _ in range(self._num_die):
-            # Simulate rolling a single D2 dice.
-            if random.random() >= 0.5:
-                value += 1
+        table = self._roll_table
+        if table is None:
+            return self.sample_roll_value_cdf()
+
+        return table[random.getrandbits(self._num_die)]
+
+    def roll_values_batch(
+            self,
+            n: int,
+            rng: np.random.Generator | None = None
+    ) -> np.ndarray:
+        """
+        Generates n random rolls using this dice at once, and
+        returns their values as an array of unsigned bytes.
+        This is much faster than calling roll_value n times.
+        If no generator is given, this dice's own generator is used.
+        It is created and seeded from the random module the first time
+        it is needed, so calling random.seed before this dice first
+        rolls a batch makes its batches reproducible.
+        """
+        if rng is None:
+            rng = self._batch_rng
+            if rng is None:
+                rng = np.random.default_rng(random.getrandbits(64))
+                self._batch_rng = rng
 
-        return value
+        values = rng.binomial(self._num_die, 0.5, size=n)
+        return values.astype(np.uint8)
+
+    def sample_roll_value_cdf(self) -> int:
+        """
+        Generates a random roll value by sampling from the
+        cumulative probabilities of each roll value. This
+        supports dice with arbitrary roll probabilities, and
+        is used to roll dice with too many die for a table.
+        """
+        cdf = self._roll_cdf
+        r = random.random()
+
+        # For few die, a linear scan beats a binary search.
+        if self._num_die <= _CDF_LINEAR_SCAN_MAX_DIE:
+            for value, cumulative in enumerate(cdf):
+                if r < cumulative:
+                    return value
+
+            return len(cdf) - 1
+
+        return min(bisect.bisect_right(cdf, r), len(cdf) - 1)
 
-    @overrides
     def generate_roll(self, value: int) -> Roll:
         if value < 0 or value > self._num_die:
             raise ValueError(f"This dice cannot roll {value}")
 
-        return Roll(value)
+        return self._rolls[value]
 
 
 class BinaryDice0AsMax(BinaryDice):
@@ -175,27 +257,38 @@ class BinaryDice0AsMax(BinaryDice):
     def __init__(self, name: str, num_die: int):
         super().__init__(name, num_die)
         self._max_roll_value = num_die + 1
-        self._roll_probabilities = [
-            0,
+        self._roll_probabilities = (
+            0.0,
             *self._roll_probabilities[1:],
-            self._roll_probabilities[0]
-        ]
+            self._roll_probabilities[0],
+        )
+        self._update_roll_cdf()
+        self._rolls = tuple(
+            Roll(value) for value in range(self._max_roll_value + 1)
+        )
+        if self._roll_table is not None:
+            self._roll_table = bytes([
+                value if value != 0 else self._max_roll_value
+                for value in self._roll_table
+            ])
 
-    @overrides
     def get_max_roll_value(self) -> int:
-        return self.max_roll_value
+        return self._max_roll_value
 
-    @overrides
-    def roll_value(self) -> int:
-        value = super().roll_value()
-        return self.max_roll_value if value == 0 else value
+    def roll_values_batch(
+            self,
+            n: int,
+            rng: np.random.Generator | None = None
+    ) -> np.ndarray:
+        values = super().roll_values_batch(n, rng)
+        values[values == 0] = self._max_roll_value
+        return values
 
-    @overrides
     def generate_roll(self, value: int) -> Roll:
-        if value <= 0 or value > self.max_roll_value:
+        if value <= 0 or value > self._max_roll_value:
             raise ValueError(f"This dice cannot roll {value}")
 
-        return Roll(value)
+        return self._rolls[value]
 
 
 class DiceType(Enum):
@@ -205,7 +298,7 @@ class DiceType(Enum):
 
     FOUR_BINARY = (
         1, "FourBinary",
-        lambda: BinaryDice("FourBinary", 4)
+        functools.partial(BinaryDice, "FourBinary", 4)
     )
     """
     The standard board shape.
@@ -213,7 +306,7 @@ class DiceType(Enum):
 
     THREE_BINARY_0MAX = (
         2, "ThreeBinary0Max",
-        lambda: BinaryDice0AsMax("ThreeBinary0Max", 3)
+        functools.partial(BinaryDice0AsMax, "ThreeBinary0Max", 3)
     )
     """
     The Aseb board shape.
@@ -3,6 +3,7 @@ from .settings import GameSettings
 
 class GameMetadata:
     # TODO
+    __slots__ = ()
 
     @staticmethod
     def create_for_new_game(settings: GameSettings) -> 'GameMetadata':
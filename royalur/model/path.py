@@ -1,7 +1,17 @@
 from .tile import Tile
 from .player import PlayerType
 from enum import Enum
-from typing import Callable
+from typing import Any
+
+
+def _get_for_player(by_player: tuple, player: PlayerType) -> Any:
+    """
+    Gets the entry for player from a tuple indexed by the index of each
+    player, where index 0 is unused. Raises a ValueError for unknown players.
+    """
+    if not isinstance(player, PlayerType):
+        raise ValueError(f"Unknown PlayerType {player}")
+    return by_player[player.index]
 
 
 class PathPair:
@@ -12,35 +22,53 @@ class PathPair:
     __slots__ = (
         "_name", "_light_with_ends", "_dark_with_ends",
         "_light", "_dark",
+        "_by_player", "_with_ends_by_player",
+        "_start_by_player", "_end_by_player",
     )
 
     _name: str
-    _light_with_ends: list[Tile]
-    _dark_with_ends: list[Tile]
-    _light: list[Tile]
-    _dark: list[Tile]
+    _light_with_ends: tuple[Tile, ...]
+    _dark_with_ends: tuple[Tile, ...]
+    _light: tuple[Tile, ...]
+    _dark: tuple[Tile, ...]
+    _by_player: tuple
+    _with_ends_by_player: tuple
+    _start_by_player: tuple
+    _end_by_player: tuple
 
     def __init__(
             self,
             name: str,
-            lightWithStartEnd: list[Tile],
-            darkWithStartEnd: list[Tile],
+            lightWithStartEnd: tuple[Tile, ...],
+            darkWithStartEnd: tuple[Tile, ...],
     ):
         self._name = name
-        self._light_with_ends = [*lightWithStartEnd]
-        self._dark_with_ends = [*darkWithStartEnd]
+        self._light_with_ends = tuple(lightWithStartEnd)
+        self._dark_with_ends = tuple(darkWithStartEnd)
         self._light = self._light_with_ends[1:-1]
         self._dark = self._dark_with_ends[1:-1]
 
+        # Lookups for each player, indexed by the index of the player.
+        self._by_player = (None, self._light, self._dark)
+        self._with_ends_by_player = (
+            None, self._light_with_ends, self._dark_with_ends
+        )
+        self._start_by_player = (
+            None, self._light_with_ends[0], self._dark_with_ends[0]
+        )
+        self._end_by_player = (
+            None, self._light_with_ends[-1], self._dark_with_ends[-1]
+        )
+
     @property
     def name(self) -> str:
         """
         The name of this path pair.
         """
-        return self.name
+        return self._name
 
     @property
-    def light_with_ends(self) -> list[Tile]:
+    def light_with_ends(self) -> tuple[Tile, ...]:
         """
         The path that light players take around the board, including
         the start and end tiles that exist off the board.
@@ -48,7 +76,7 @@ class PathPair:
         return self._light_with_ends
 
     @property
-    def dark_with_ends(self) -> list[Tile]:
+    def dark_with_ends(self) -> tuple[Tile, ...]:
         """
         The path that dark players take around the board, including
         the start and end tiles that exist off the board.
@@ -56,7 +84,7 @@ class PathPair:
         return self._dark_with_ends
 
     @property
-    def light(self) -> list[Tile]:
+    def light(self) -> tuple[Tile, ...]:
         """
         The path that light players take around the board, excluding
         the start and end tiles that exist off the board.
@@ -64,7 +92,7 @@ class PathPair:
         return self._light
 
     @property
-    def dark(self) -> list[Tile]:
+    def dark(self) -> tuple[Tile, ...]:
         """
         The path that dark players take around the board, excluding
         the start and end tiles that exist off the board.
@@ -99,41 +127,31 @@ class PathPair:
         """
         return self._dark_with_ends[-1]
 
-    def get(self, player: PlayerType) -> list[Tile]:
+    def get(self, player: PlayerType) -> tuple[Tile, ...]:
         """
         Gets the path of the given player, excluding the start and
         end tiles that exist off the board.
         """
-        if player == PlayerType.LIGHT:
-            return self._light
-        elif player == PlayerType.DARK:
-            return self._dark
-        else:
-            raise ValueError(f"Unknown PlayerType {player}")
+        return _get_for_player(self._by_player, player)
 
-    def get_with_ends(self, player: PlayerType) -> list[Tile]:
+    def get_with_ends(self, player: PlayerType) -> tuple[Tile, ...]:
         """
         Gets the path of the given player, including the start and
         end tiles that exist off the board.
         """
-        if player == PlayerType.LIGHT:
-            return self._light_with_ends
-        elif player == PlayerType.DARK:
-            return self._dark_with_ends
-        else:
-            raise ValueError(f"Unknown PlayerType {player}")
+        return _get_for_player(self._with_ends_by_player, player)
 
-    def get_start(self, player: PlayerType) -> list[Tile]:
+    def get_start(self, player: PlayerType) -> Tile:
         """
         Gets the start tile of the given player, which exists off the board.
         """
-        return self.get_with_ends(player)[0]
+        return _get_for_player(self._start_by_player, player)
 
-    def get_end(self, player: PlayerType) -> list[Tile]:
+    def get_end(self, player: PlayerType) -> Tile:
         """
         Gets the end tile of the given player, which exists off the board.
         """
-        return self.get_with_ends(player)[-1]
+        return _get_for_player(self._end_by_player, player)
 
     def is_equivalent(self, other: 'PathPair') -> bool:
         """
@@ -168,7 +186,7 @@ class AsebPathPair(PathPair):
     The name of this type of path pair.
     """
 
-    LIGHT_PATH: list[Tile] = Tile.create_path(
+    LIGHT_PATH: tuple[Tile, ...] = Tile.create_path(
         (1, 5),
         (1, 1),
         (2, 1),
@@ -179,7 +197,7 @@ class AsebPathPair(PathPair):
     The path of the light player's pieces.
     """
 
-    DARK_PATH: list[Tile] = Tile.create_path(
+    DARK_PATH: tuple[Tile, ...] = Tile.create_path(
         (3, 5),
         (3, 1),
         (2, 1),
@@ -213,7 +231,7 @@ class BellPathPair(PathPair):
     The name of this type of path pair.
     """
 
-    LIGHT_PATH: list[Tile] = Tile.create_path(
+    LIGHT_PATH: tuple[Tile, ...] = Tile.create_path(
         (1, 5),
         (1, 1),
         (2, 1),
@@ -225,7 +243,7 @@ class BellPathPair(PathPair):
     The path of the light player's pieces.
     """
 
-    DARK_PATH: list[Tile] = Tile.create_path(
+    DARK_PATH: tuple[Tile, ...] = Tile.create_path(
         (3, 5),
         (3, 1),
         (2, 1),
@@ -260,7 +278,7 @@ class MastersPathPair(PathPair):
     The name of this type of path pair.
     """
 
-    LIGHT_PATH: list[Tile] = Tile.create_path(
+    LIGHT_PATH: tuple[Tile, ...] = Tile.create_path(
         (1, 5),
         (1, 1),
         (2, 1),
@@ -274,7 +292,7 @@ class MastersPathPair(PathPair):
     The path of the light player's pieces.
     """
 
-    DARK_PATH: list[Tile] = Tile.create_path(
+    DARK_PATH: tuple[Tile, ...] = Tile.create_path(
         (3, 5),
         (3, 1),
         (2, 1),
@@ -310,7 +328,7 @@ class MurrayPathPair(PathPair):
     The name of this type of path pair.
     """
 
-    LIGHT_PATH: list[Tile] = Tile.create_path(
+    LIGHT_PATH: tuple[Tile, ...] = Tile.create_path(
         (1, 5),
         (1, 1),
         (2, 1),
@@ -328,7 +346,7 @@ class MurrayPathPair(PathPair):
     The path of the light player's pieces.
     """
 
-    DARK_PATH: list[Tile] = Tile.create_path(
+    DARK_PATH: tuple[Tile, ...] = Tile.create_path(
         (3, 5),
         (3, 1),
         (2, 1),
@@ -368,7 +386,7 @@ class SkiriukPathPair(PathPair):
     The name of this type of path pair.
     """
 
-    LIGHT_PATH: list[Tile] = Tile.create_path(
+    LIGHT_PATH: tuple[Tile, ...] = Tile.create_path(
         (1, 5),
         (1, 1),
         (2, 1),
@@ -384,7 +402,7 @@ class SkiriukPathPair(PathPair):
     The path of the light player's pieces.
     """
 
-    DARK_PATH: list[Tile] = Tile.create_path(
+    DARK_PATH: tuple[Tile, ...] = Tile.create_path(
         (3, 5),
         (3, 1),
         (2, 1),
@@ -413,27 +431,27 @@ class PathType(Enum):
     The type of path to use in a game.
     """
 
-    BELL = (1, BellPathPair.NAME, lambda: BellPathPair())
+    BELL = (1, BellPathPair.NAME, BellPathPair)
     """
     The path proposed by Bell for the Royal Game of Ur.
     """
 
-    ASEB = (2, AsebPathPair.NAME, lambda: AsebPathPair())
+    ASEB = (2, AsebPathPair.NAME, AsebPathPair)
     """
     The standard path used for Aseb.
     """
 
-    MASTERS = (3, MastersPathPair.NAME, lambda: MastersPathPair())
+    MASTERS = (3, MastersPathPair.NAME, MastersPathPair)
     """
     The path proposed by Masters for the Royal Game of Ur.
     """
 
-    MURRAY = (4, MurrayPathPair.NAME, lambda: MurrayPathPair())
+    MURRAY = (4, MurrayPathPair.NAME, MurrayPathPair)
     """
     The path proposed by Murray for the Royal Game of Ur.
     """
 
-    SKIRIUK = (5, SkiriukPathPair.NAME, lambda: SkiriukPathPair())
+    SKIRIUK = (5, SkiriukPathPair.NAME, SkiriukPathPair)
     """
     The path proposed by Skiriuk for the Royal Game of Ur.
     """
@@ -442,11 +460,12 @@ class PathType(Enum):
             self,
             value: int,
             text_name: str,
-            create_path_pair: Callable[[], PathPair]
+            path_pair_class: type[PathPair]
     ):
         self._value_ = value
         self._text_name = text_name
-        self._create_path_pair = create_path_pair
+        self._path_pair_class = path_pair_class
+        self._path_pair = None
 
     @property
     def text_name(self) -> str:
@@ -457,6 +476,9 @@ class PathType(Enum):
 
     def create_path_pair(self) -> PathPair:
         """
-        Create an instance of the paths.
+        Get an instance of the paths. Path pairs are immutable, so
+        the instance is created once and shared by all callers.
         """
-        return self._create_path_pair()
+        if self._path_pair is None:
+            self._path_pair = self._path_pair_class()
+        return self._path_pair
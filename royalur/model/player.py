@@ -18,6 +18,9 @@ class PlayerType(Enum):
 
     def __init__(self, value: int, text_name: str, character: str):
         self._value_ = value
+        # The value is also stored as a plain attribute, as it is used to
+        # index per-player lookups and reading Enum.value is much slower.
+        self.index = value
         self._text_name = text_name
         self._character = character
 
@@ -39,12 +42,7 @@ class PlayerType(Enum):
         """
         Retrieve the PlayerType representing the other player.
         """
-        if self == PlayerType.LIGHT:
-            return PlayerType.DARK
-        elif self == PlayerType.DARK:
-            return PlayerType.LIGHT
-        else:
-            raise ValueError(f"Unknown PlayerType {self}")
+        return self._other_player
 
     @staticmethod
     def to_char(player: Optional['PlayerType']) -> str:
@@ -55,6 +53,10 @@ class PlayerType(Enum):
         return player.character if player else '.'
 
 
+PlayerType.LIGHT._other_player = PlayerType.DARK
+PlayerType.DARK._other_player = PlayerType.LIGHT
+
+
 class PlayerState:
     """
     A player state represents the state of a single player
@@ -4,6 +4,15 @@ from .dice import Dice, DiceType
 from typing import Union, Callable
 
 
+def check_starting_piece_count(starting_piece_count: int):
+    """
+    Raises a ValueError if the given number of starting
+    pieces is not valid for a game.
+    """
+    if starting_piece_count < 1:
+        raise ValueError("starting piece count must be at least 1")
+
+
 class GameSettings:
     """
     Settings for running games of the Royal Game of Ur. This is built for
@@ -36,8 +45,7 @@ class GameSettings:
             rosettes_grant_extra_rolls: bool,
             captures_grant_extra_rolls: bool,
     ):
-        if starting_piece_count < 1:
-            raise ValueError("starting piece count must be at least 1")
+        check_starting_piece_count(starting_piece_count)
 
         self._board_shape = board_shape
         self._paths = paths
@@ -56,7 +64,7 @@ class GameSettings:
         return GameSettings(
             BoardType.STANDARD.create_board_shape(),
             PathType.BELL.create_path_pair(),
-            lambda: DiceType.FOUR_BINARY.create_dice(),
+            DiceType.FOUR_BINARY.dice_factory,
             pawns,
             True,
             True,
@@ -71,7 +79,7 @@ class GameSettings:
         return GameSettings(
             BoardType.STANDARD.create_board_shape(),
             PathType.MASTERS.create_path_pair(),
-            lambda: DiceType.FOUR_BINARY.create_dice(),
+            DiceType.FOUR_BINARY.dice_factory,
             7,
             False,
             True,
@@ -86,7 +94,7 @@ class GameSettings:
         return GameSettings(
             BoardType.ASEB.create_board_shape(),
             PathType.ASEB.create_path_pair(),
-            lambda: DiceType.FOUR_BINARY.create_dice(),
+            DiceType.FOUR_BINARY.dice_factory,
             5,
             True,
             True,
@@ -154,10 +162,7 @@ class GameSettings:
         Generates new game settings with new dice.
         """
         if isinstance(dice, DiceType):
-            def create_from_dice_type():
-                return dice.create_dice()
-
-            dice = create_from_dice_type
+            dice = dice.dice_factory
 
         return GameSettings(
             self._board_shape, self._paths, dice,
@@ -1,7 +1,7 @@
 from .tile import Tile
 from .path import BellPathPair, AsebPathPair
 from enum import Enum
-from typing import Iterable, Callable
+from typing import Iterable
 
 
 class BoardShape:
@@ -9,39 +9,69 @@ class BoardShape:
     Holds the shape of a board as a grid, and includes
     the location of all rosette tiles.
     """
-    __slots__ = ("_name", "_tiles", "_rosettes", "_width", "_height")
+    __slots__ = (
+        "_name", "_tiles", "_rosettes", "_width", "_height",
+        "_tiles_mask", "_rosettes_mask", "_hash",
+    )
 
     _name: str
-    _tiles: set[Tile]
-    _rosettes: set[Tile]
+    _tiles: frozenset[Tile]
+    _rosettes: frozenset[Tile]
     _width: int
     _height: int
+    _tiles_mask: int
+    """
+    A bitboard of the tiles in this shape, where the tile at the
+    indices (ix, iy) is stored in bit ix * height + iy.
+    """
+    _rosettes_mask: int
+    """
+    A bitboard of the rosette tiles in this shape, in the same
+    layout as _tiles_mask.
+    """
+    _hash: int
 
     def __init__(
             self,
             name: str,
-            tiles: set[Tile],
-            rosettes: set[Tile]
+            tiles: Iterable[Tile],
+            rosettes: Iterable[Tile]
     ):
-
+        tiles = frozenset(tiles)
+        rosettes = frozenset(rosettes)
         if len(tiles) == 0:
             raise ValueError("A board shape requires at least one tile")
 
-        for rosette in rosettes:
-            if rosette not in tiles:
-                raise ValueError(
-                    f"Rosette at {rosette} does not exist on the board"
-                )
+        if not tiles.issuperset(rosettes):
+            for rosette in rosettes:
+                if rosette not in tiles:
+                    raise ValueError(
+                        f"Rosette at {rosette} does not exist on the board"
+                    )
 
         self._name = name
         self._tiles = tiles
         self._rosettes = rosettes
 
-        x_values = [tile._x for tile in tiles]
-        y_values = [tile._y for tile in tiles]
+        # Find the bounds of the tiles in a single pass.
+        min_x = min_y = max_x = max_y = None
+        for tile in tiles:
+            x = tile._x
+            y = tile._y
+            if min_x is None:
+                min_x = max_x = x
+                min_y = max_y = y
+                continue
+
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
 
-        min_x = min(x_values)
-        min_y = min(y_values)
         if min_x != 1 or min_y != 1:
             raise ValueError(
                 f"The board shape must be translated such that it has tiles "
@@ -49,8 +79,22 @@ class BoardShape:
                 f"Minimum X = {min_x}, Minimum Y = {min_y}"
             )
 
-        self._width = max(x_values)
-        self._height = max(y_values)
+        self._width = max_x
+        self._height = max_y
+        self._tiles_mask = self._create_mask(tiles)
+        self._rosettes_mask = self._create_mask(rosettes)
+        self._hash = hash((
+            self._name, self._height, self._tiles_mask, self._rosettes_mask
+        ))
+
+    def _create_mask(self, tiles: Iterable[Tile]) -> int:
+        """
+        Creates a bitboard with the bits of the given tiles set.
+        """
+        mask = 0
+        for tile in tiles:
+            mask |= 1 << (tile._ix * self._height + tile._iy)
+        return mask
 
     @property
     def name(self) -> str:
@@ -60,14 +104,14 @@ class BoardShape:
         return self._name
 
     @property
-    def tiles(self) -> set[Tile]:
+    def tiles(self) -> frozenset[Tile]:
         """
         The set of tiles that fall within the bounds of this board shape.
         """
         return self._tiles
 
     @property
-    def rosettes(self) -> set[Tile]:
+    def rosettes(self) -> frozenset[Tile]:
         """
         The set of tiles that represent rosette tiles in this board shape.
         """
@@ -98,42 +142,59 @@ class BoardShape:
         """
         Determines whether the given tile falls within this board shape.
         """
-        return tile in self._tiles
+        # Objects that are not tiles are never contained in the shape.
+        if not isinstance(tile, Tile):
+            return False
+
+        ix = tile._ix
+        iy = tile._iy
+        height = self._height
+        if ix < 0 or iy < 0 or ix >= self._width or iy >= height:
+            return False
+        return (self._tiles_mask >> (ix * height + iy)) & 1 == 1
 
     def contains_indices(self, ix: int, iy: int) -> bool:
         """
         Determines whether the tile at indices (ix, iy),
         0-based, falls within the bounds of this shape of board.
         """
-        if ix < 0 or iy < 0 or ix >= self._width or iy >= self._height:
+        height = self._height
+        if ix < 0 or iy < 0 or ix >= self._width or iy >= height:
             return False
-        return self.contains(Tile.from_indices(ix, iy))
+        return (self._tiles_mask >> (ix * height + iy)) & 1 == 1
 
     def contains_all(self, tiles: Iterable[Tile]) -> bool:
         """
         Determines whether all provided tiles fall
         within this board shape.
         """
-        for tile in tiles:
-            if not self.contains(tile):
-                return False
-        return True
+        contains = self.contains
+        return all(contains(tile) for tile in tiles)
 
     def is_rosette(self, tile: Tile) -> bool:
         """
         Determines whether the given tile is a rosette
         tile in this board shape.
         """
-        return tile in self._rosettes
+        if not isinstance(tile, Tile):
+            return False
+
+        ix = tile._ix
+        iy = tile._iy
+        height = self._height
+        if ix < 0 or iy < 0 or ix >= self._width or iy >= height:
+            return False
+        return (self._rosettes_mask >> (ix * height + iy)) & 1 == 1
 
     def is_rosette_indices(self, ix: int, iy: int) -> bool:
         """
         Determines whether the tile at the indices (ix, iy), 0-based,
         is a rosette tile in this board shape.
         """
-        if ix < 0 or iy < 0 or ix >= self._width or iy >= self._height:
+        height = self._height
+        if ix < 0 or iy < 0 or ix >= self._width or iy >= height:
             return False
-        return self.isRosette(Tile.from_indices(ix, iy))
+        return (self._rosettes_mask >> (ix * height + iy)) & 1 == 1
 
     def is_equivalent(self, other: 'BoardShape') -> bool:
         """
@@ -141,14 +202,22 @@ class BoardShape:
         and has the same rosettes, as other. This does not check
         that the names of the board shapes are the same.
         """
-        return self._tiles == other._tiles \
-            and self._rosettes == other._rosettes
+        # Shapes with the same tiles have the same height, and therefore
+        # the same bitboard layout, so the bitboards can be compared.
+        return self._height == other._height \
+            and self._tiles_mask == other._tiles_mask \
+            and self._rosettes_mask == other._rosettes_mask
 
     def __eq__(self, other: 'BoardShape') -> bool:
+        if self is other:
+            return True
         if type(other) is not type(self):
             return False
         return self.is_equivalent(other) and self._name == other._name
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 class AsebBoardShape(BoardShape):
     """
@@ -164,21 +233,21 @@ class AsebBoardShape(BoardShape):
     The name given to this board shape.
     """
 
-    BOARD_TILES: set[Tile] = (
-        set(AsebPathPair.LIGHT_PATH[1:-1])
-        .union(set(AsebPathPair.DARK_PATH[1:-1]))
+    BOARD_TILES: frozenset[Tile] = (
+        frozenset(AsebPathPair.LIGHT_PATH[1:-1])
+        .union(AsebPathPair.DARK_PATH[1:-1])
     )
     """
     The set of all tiles that exist on the board.
     """
 
-    ROSETTE_TILES: set[Tile] = {
+    ROSETTE_TILES: frozenset[Tile] = frozenset({
         Tile(1, 1),
         Tile(3, 1),
         Tile(2, 4),
         Tile(2, 8),
         Tile(2, 12)
-    }
+    })
     """
     The set of rosette tiles that exist on the board.
     """
@@ -203,21 +272,21 @@ class StandardBoardShape(BoardShape):
     The name given to this board shape.
     """
 
-    BOARD_TILES: set[Tile] = (
-        set(BellPathPair.LIGHT_PATH[1:-1])
-        .union(set(BellPathPair.DARK_PATH[1:-1]))
+    BOARD_TILES: frozenset[Tile] = (
+        frozenset(BellPathPair.LIGHT_PATH[1:-1])
+        .union(BellPathPair.DARK_PATH[1:-1])
     )
     """
     The set of all tiles that exist on the board.
     """
 
-    ROSETTE_TILES: set[Tile] = {
+    ROSETTE_TILES: frozenset[Tile] = frozenset({
         Tile(1, 1),
         Tile(3, 1),
         Tile(2, 4),
         Tile(1, 7),
         Tile(3, 7)
-    }
+    })
     """
     The set of rosette tiles that exist on the board.
     """
@@ -235,12 +304,12 @@ class BoardType(Enum):
     The type of board to use in a game.
     """
 
-    STANDARD = (1, StandardBoardShape.NAME, lambda: StandardBoardShape())
+    STANDARD = (1, StandardBoardShape.NAME, StandardBoardShape)
     """
     The standard board shape.
     """
 
-    ASEB = (2, AsebBoardShape.NAME, lambda: AsebBoardShape())
+    ASEB = (2, AsebBoardShape.NAME, AsebBoardShape)
     """
     The Aseb board shape.
     """
@@ -249,11 +318,12 @@ class BoardType(Enum):
             self,
             value: int,
             text_name: str,
-            create_board_shape: Callable[[], BoardShape]
+            board_shape_class: type[BoardShape]
     ):
         self._value_ = value
         self._text_name = text_name
-        self._create_board_shape = create_board_shape
+        self._board_shape_class = board_shape_class
+        self._board_shape = None
 
     @property
     def text_name(self) -> str:
@@ -264,6 +334,10 @@ class BoardType(Enum):
 
     def create_board_shape(self) -> BoardShape:
         """
-        Create an instance of the board shape.
+        Get an instance of the board shape. Board shapes are not
+        modified once created, so the instance is created once and
+        shared by all callers.
         """
-        return self._create_board_shape()
+        if self._board_shape is None:
+            self._board_shape = self._board_shape_class()
+        return self._board_shape
@@ -4,14 +4,21 @@ class Tile:
     """
     Represents a position on or off the board.
     """
-    __slots__ = ("_x", "_y", "_ix", "_iy")
+    __slots__ = ("_x", "_y", "_ix", "_iy", "_key", "_text")
 
     _x: int
     _y: int
     _ix: int
     _iy: int
+    _key: int
+    """
+    The coordinates of the tile packed into a single integer,
+    which is unique to each tile.
+    """
+    _text: str
 
-    def __init__(self, x: int, y: int):
+    def __new__(cls, x: int, y: int) -> 'Tile':
+        # Tiles are immutable, so a single instance is shared for each position.
         if x < 1 or x > 26:
             raise ValueError(
                 f"x must fall within the range [1, 26]. Invalid value: {x}"
@@ -21,10 +28,25 @@ class Tile:
                 f"y must not be negative. Invalid value: {y}"
             )
 
-        self._x = x
-        self._y = y
-        self._ix = x - 1
-        self._iy = y - 1
+        key = (y << 5) | x
+        tile = _TILES.get(key)
+        if tile is not None:
+            return tile
+
+        tile = super().__new__(cls)
+        tile._x = x
+        tile._y = y
+        tile._ix = x - 1
+        tile._iy = y - 1
+        tile._key = key
+        tile._text = f"{chr(x + (ord('A') - 1))}{y}"
+        _TILES[key] = tile
+        if len(tile._text) <= 3:
+            _TILES_BY_STRING[tile._text] = tile
+        return tile
+
+    def __getnewargs__(self) -> tuple[int, int]:
+        return self._x, self._y
 
     @property
     def x(self) -> int:
@@ -54,11 +76,18 @@ class Tile:
         """
         return self._iy
 
+    @staticmethod
+    def get(x: int, y: int) -> 'Tile':
+        """
+        Gets the tile at the coordinates (x, y), 1-based. This is
+        equivalent to Tile(x, y), which is interned.
+        """
+        return Tile(x, y)
+
     @staticmethod
     def from_indices(ix: int, iy: int) -> 'Tile':
         """
-        Creates a new tile representing the tile at the
-        indices (ix, iy), 0-based.
+        Gets the tile at the indices (ix, iy), 0-based.
         """
         return Tile(ix + 1, iy + 1)
 
@@ -78,26 +107,31 @@ class Tile:
             return Tile(self._x + (1 if dx > 0 else -1), self._y)
 
     def __hash__(self) -> int:
-        return hash((self._x, self._y))
+        return self._key
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if type(other) is not type(self):
             return False
 
-        return self._x == other._x and self._y == other._y
+        return self._key == other._key
 
     def __repr__(self) -> str:
-        encoded_x = chr(self._x + (ord('A') - 1))
-        return f"{encoded_x}{self._y}"
+        return self._text
 
     def __str__(self) -> str:
-        return repr(self)
+        return self._text
 
     @staticmethod
     def from_string(encoded: str) -> 'Tile':
         """
         Decodes the tile coordinates from its encoded text (e.g., A4).
         """
+        tile = _TILES_BY_STRING.get(encoded)
+        if tile is not None:
+            return tile
+
         if len(encoded) < 2:
             raise ValueError(
                 "Incorrect format, expected at least two characters"
@@ -115,7 +149,7 @@ class Tile:
         return [Tile(x, y) for x, y in coordinates]
 
     @staticmethod
-    def create_path(*coordinates: list[tuple[int, int]]) -> list['Tile']:
+    def create_path(*coordinates: list[tuple[int, int]]) -> tuple['Tile', ...]:
         """
         Constructs a path from waypoints on the board.
         """
@@ -123,12 +157,35 @@ class Tile:
         if len(waypoints) == 0:
             raise ValueError("No coordinates provided")
 
+        # Walk the path using the coordinates directly, taking the
+        # same unit steps as step_towards, without building a tile
+        # for every intermediate step of the walk.
         path = [waypoints[0]]
-        for index in range(1, len(waypoints)):
-            current = waypoints[index - 1]
-            next = waypoints[index]
-            while current != next:
-                current = current.step_towards(next)
-                path.append(current)
-
-        return path
+        x = waypoints[0]._x
+        y = waypoints[0]._y
+        for waypoint in waypoints[1:]:
+            target_x = waypoint._x
+            target_y = waypoint._y
+            while x != target_x or y != target_y:
+                dx = target_x - x
+                dy = target_y - y
+                if abs(dx) < abs(dy):
+                    y += 1 if dy > 0 else -1
+                else:
+                    x += 1 if dx > 0 else -1
+                path.append(Tile(x, y))
+
+        return tuple(path)
+
+
+_TILES: dict[int, Tile] = {}
+"""
+The tiles that have been created, keyed by their packed coordinates.
+"""
+
+_TILES_BY_STRING: dict[str, Tile] = {}
+"""
+The tiles that have been created, keyed by their text. Only tiles with
+short text are included, and other spellings of a tile are not cached,
+so that the cache stays small no matter what text is decoded.
+"""
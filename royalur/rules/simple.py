@@ -22,8 +22,28 @@ from typing import Callable
 class SimplePieceProvider(PieceProvider):
     """
     Provides new instances of, and manipulations to, simple pieces.
+    Simple pieces are immutable, so each distinct piece is only
+    created once and then reused.
     """
-    __slots__ = ()
+    __slots__ = ("_pieces",)
+
+    _pieces: dict[tuple[PlayerType, int], Piece]
+
+    def __init__(self):
+        super().__init__()
+        self._pieces = {}
+
+    def _get_piece(self, owner: PlayerType, path_index: int) -> Piece:
+        """
+        Gets the shared piece with the given owner and path index.
+        """
+        key = (owner, path_index)
+        piece = self._pieces.get(key)
+        if piece is None:
+            piece = Piece(owner, path_index)
+            self._pieces[key] = piece
+
+        return piece
 
     @overrides
     def create_introduced(
@@ -32,7 +52,7 @@ class SimplePieceProvider(PieceProvider):
             new_path_index: int
     ) -> Piece:
 
-        return Piece(owner, new_path_index)
+        return self._get_piece(owner, new_path_index)
 
     @overrides
     def create_moved(
@@ -41,20 +61,42 @@ class SimplePieceProvider(PieceProvider):
             new_path_index: int
     ) -> Piece:
 
-        return Piece(origin_piece.owner, new_path_index)
+        return self._get_piece(origin_piece.owner, new_path_index)
 
 
 class SimplePlayerStateProvider(PlayerStateProvider):
     """
     Provides new instances of, and manipulations to, simple player states.
+    Player states are immutable, so each distinct state is only
+    created once and then reused.
     """
-    __slots__ = ("_starting_piece_count",)
+    __slots__ = ("_starting_piece_count", "_player_states")
 
     _starting_piece_count: int
+    _player_states: dict[tuple[PlayerType, int, int], PlayerState]
 
     def __init__(self, starting_piece_count: int):
         super().__init__()
         self._starting_piece_count = starting_piece_count
+        self._player_states = {}
+
+    def _get_player_state(
+            self,
+            player: PlayerType,
+            piece_count: int,
+            score: int
+    ) -> PlayerState:
+        """
+        Gets the shared state of the given player with
+        the given piece count and score.
+        """
+        key = (player, piece_count, score)
+        player_state = self._player_states.get(key)
+        if player_state is None:
+            player_state = PlayerState(player, piece_count, score)
+            self._player_states[key] = player_state
+
+        return player_state
 
     @overrides
     def get_starting_piece_count(self) -> int:
@@ -62,11 +104,11 @@ class SimplePlayerStateProvider(PlayerStateProvider):
 
     @overrides
     def create(self, player: PlayerType):
-        return PlayerState(player, self._starting_piece_count, 0)
+        return self._get_player_state(player, self._starting_piece_count, 0)
 
     @overrides
     def apply_piece_introduced(self, player_state: PlayerState, piece: Piece):
-        return PlayerState(
+        return self._get_player_state(
             player_state.player,
             player_state.piece_count - 1,
             player_state.score
@@ -74,7 +116,7 @@ class SimplePlayerStateProvider(PlayerStateProvider):
 
     @overrides
     def apply_piece_captured(self, player_state: PlayerState, piece: Piece):
-        return PlayerState(
+        return self._get_player_state(
             player_state.player,
             player_state.piece_count + 1,
             player_state.score
@@ -82,7 +124,7 @@ class SimplePlayerStateProvider(PlayerStateProvider):
 
     @overrides
     def apply_piece_scored(self, player_state: PlayerState, piece: Piece):
-        return PlayerState(
+        return self._get_player_state(
             player_state.player,
             player_state.piece_count,
             player_state.score + 1
@@ -97,12 +139,16 @@ class SimpleRuleSet(RuleSet):
     __slots__ = (
         "_safe_rosettes",
         "_rosettes_grant_extra_rolls",
-        "_captures_grant_extra_rolls"
+        "_captures_grant_extra_rolls",
+        "_path_rosettes",
+        "_path_board_indices",
     )
 
     _safe_rosettes: bool
     _rosettes_grant_extra_rolls: bool
     _captures_grant_extra_rolls: bool
+    _path_rosettes: dict[PlayerType, tuple[bool, ...]]
+    _path_board_indices: dict[PlayerType, tuple[int, ...]]
 
     def __init__(
             self,
@@ -123,6 +169,22 @@ class SimpleRuleSet(RuleSet):
         self._rosettes_grant_extra_rolls = rosettes_grant_extra_rolls
         self._captures_grant_extra_rolls = captures_grant_extra_rolls
 
+        # Whether each tile along each player's path is a rosette.
+        self._path_rosettes = {
+            player: tuple(board_shape.is_rosette(tile) for tile in paths.get(player))
+            for player in PlayerType
+        }
+
+        # The index into the pieces of a board of each tile along each
+        # player's path, so that moves can be found without tile lookups.
+        self._path_board_indices = {
+            player: tuple(
+                tile.iy * board_shape.width + tile.ix
+                for tile in paths.get(player)
+            )
+            for player in PlayerType
+        }
+
     @overrides
     def are_rosettes_safe(self) -> bool:
         return self._safe_rosettes
@@ -152,18 +214,26 @@ class SimpleRuleSet(RuleSet):
         roll: Roll
     ) -> list[Move]:
 
-        if roll.value == 0:
+        roll_value = roll.value
+        if roll_value == 0:
             return []
 
+        # Hoist the lookups used for every candidate move.
         player_type = player.player
         path = self._paths.get(player_type)
+        path_length = len(path)
+        path_rosettes = self._path_rosettes[player_type]
+        path_indices = self._path_board_indices[player_type]
+        safe_rosettes = self._safe_rosettes
+        pieces = board.pieces
+        piece_provider = self._piece_provider
         moves = []
 
         # Check if a piece can be taken off the board.
-        if roll.value <= len(path):
-            score_path_index = len(path) - roll.value
+        if roll_value <= path_length:
+            score_path_index = path_length - roll_value
             score_tile = path[score_path_index]
-            score_piece = board.get(score_tile)
+            score_piece = pieces[path_indices[score_path_index]]
             if score_piece is not None \
                     and score_piece.owner == player_type \
                     and score_piece.path_index == score_path_index:
@@ -175,12 +245,12 @@ class SimpleRuleSet(RuleSet):
 
         # Check for pieces on the board that can be moved
         # to another tile on the board.
-        for path_index in range(-1, len(path) - roll.value):
+        for path_index in range(-1, path_length - roll_value):
 
             if path_index >= 0:
                 # Move a piece on the board.
                 tile = path[path_index]
-                piece = board.get(tile)
+                piece = pieces[path_indices[path_index]]
                 if piece is None \
                         or piece.owner != player_type \
                         or piece.path_index != path_index:
@@ -195,9 +265,9 @@ class SimpleRuleSet(RuleSet):
                 continue
 
             # Check if the destination is free.
-            dest_path_index = path_index + roll.value
+            dest_path_index = path_index + roll_value
             dest = path[dest_path_index]
-            dest_piece = board.get(dest)
+            dest_piece = pieces[path_indices[dest_path_index]]
 
             if dest_piece is not None:
                 # Cannot capture your own piece.
@@ -205,16 +275,16 @@ class SimpleRuleSet(RuleSet):
                     continue
 
                 # Can't capture pieces on rosettes if they are safe.
-                if self._safe_rosettes and self._board_shape.is_rosette(dest):
+                if safe_rosettes and path_rosettes[dest_path_index]:
                     continue
 
             # Generate the move.
             if path_index >= 0:
-                moved_piece = self._piece_provider.create_moved(
+                moved_piece = piece_provider.create_moved(
                     piece, dest_path_index
                 )
             else:
-                moved_piece = self._piece_provider.create_introduced(
+                moved_piece = piece_provider.create_introduced(
                     player_type, dest_path_index
                 )
 
@@ -286,22 +356,26 @@ class SimpleRuleSet(RuleSet):
         # Apply the move to the player that made the move.
         turn_player = state.get_turn_player()
 
-        if move.is_introducing_piece():
-            introduced_piece = move.get_dest_piece()
+        # A move's source and source piece are either both set or both
+        # None, as are its destination and destination piece, so the
+        # pieces can be read directly without the checked getters.
+        source_piece = move.source_piece
+        dest_piece = move.dest_piece
+        captured_piece = move.captured_piece
+        is_scoring = dest_piece is None
+        if source_piece is None:
             turn_player = self._player_state_provider.apply_piece_introduced(
-                turn_player, introduced_piece
+                turn_player, dest_piece
             )
 
-        elif move.is_scoring_piece():
-            scored_piece = move.get_source_piece()
+        elif is_scoring:
             turn_player = self._player_state_provider.apply_piece_scored(
-                turn_player, scored_piece
+                turn_player, source_piece
             )
 
         # Apply the effects of the move to the other player.
         other_player = state.get_waiting_player()
-        if move.is_capture():
-            captured_piece = move.get_captured_piece()
+        if captured_piece is not None:
             other_player = self._player_state_provider.apply_piece_captured(
                 other_player, captured_piece
             )
@@ -317,8 +391,7 @@ class SimpleRuleSet(RuleSet):
 
         # Check if the player has won the game.
         turn_player_pieces = turn_player.piece_count
-        if move.is_scoring_piece() \
-                and turn_player_pieces + board.count_pieces(turn) <= 0:
+        if is_scoring and turn_player_pieces + board.count_pieces(turn) <= 0:
 
             return [moved_state, WinGameState(
                 board, light_player, dark_player, turn
@@ -6,6 +6,14 @@ from .state import (
     GameState,
     OngoingGameState,
     WinGameState,
+    KIND_OTHER,
+    KIND_PLAYABLE,
+    KIND_WAITING_FOR_ROLL,
+    KIND_WAITING_FOR_MOVE,
+    KIND_ACTION,
+    KIND_ROLLED,
+    KIND_MOVED,
+    KIND_WIN,
 )
 from .action import (
     ActionGameState,
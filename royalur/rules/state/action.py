@@ -1,5 +1,5 @@
 from royalur.model import Board, PlayerState, PlayerType, Roll, Move
-from .state import OngoingGameState
+from .state import OngoingGameState, KIND_ACTION, KIND_ROLLED, KIND_MOVED
 from overrides import overrides
 
 
@@ -11,6 +11,8 @@ class ActionGameState(OngoingGameState):
     """
     __slots__ = ()
 
+    KIND: int = KIND_ACTION
+
     @overrides
     def is_playable(self) -> bool:
         return False
@@ -22,6 +24,8 @@ class RolledGameState(ActionGameState):
     """
     __slots__ = ("_roll", "_available_moves")
 
+    KIND: int = KIND_ROLLED
+
     _roll: Roll
     _available_moves: list[Move]
 
@@ -77,6 +81,8 @@ class MovedGameState(ActionGameState):
     """
     __slots__ = ("_roll", "_move")
 
+    KIND: int = KIND_MOVED
+
     _roll: Roll
     _move: Move
 
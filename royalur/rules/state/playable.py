@@ -1,5 +1,10 @@
-from royalur.model import Board, PlayerState, PlayerType, Roll, Move
-from .state import OngoingGameState
+from royalur.model import (
+    Board, PlayerState, PlayerType, Roll, Move, Piece, Tile, PathPair,
+)
+from .state import (
+    OngoingGameState,
+    KIND_PLAYABLE, KIND_WAITING_FOR_ROLL, KIND_WAITING_FOR_MOVE,
+)
 from overrides import overrides
 
 
@@ -9,6 +14,8 @@ class PlayableGameState(OngoingGameState):
     """
     __slots__ = ()
 
+    KIND: int = KIND_PLAYABLE
+
     @overrides
     def is_playable(self) -> bool:
         return True
@@ -19,6 +26,8 @@ class WaitingForRollGameState(PlayableGameState):
     A game state where the game is waiting for a player to roll the dice.
     """
 
+    KIND: int = KIND_WAITING_FOR_ROLL
+
     @overrides
     def describe(self) -> str:
         turn = self.get_turn().text_name.lower()
@@ -29,10 +38,19 @@ class WaitingForMoveGameState(PlayableGameState):
     """
     A game state where the game is waiting for a player to roll the dice.
     """
-    __slots__ = ("_roll", "_available_moves")
+    __slots__ = (
+        "_roll", "_available_moves",
+        "_moves_by_source_piece", "_moves_by_source_tile",
+        "_introducing_move",
+    )
+
+    KIND: int = KIND_WAITING_FOR_MOVE
 
     _roll: Roll
     _available_moves: list[Move]
+    _moves_by_source_piece: dict[Piece, Move] | None
+    _moves_by_source_tile: dict[Tile, Move] | None
+    _introducing_move: Move | None
 
     def __init__(
             self,
@@ -46,6 +64,9 @@ class WaitingForMoveGameState(PlayableGameState):
         super().__init__(board, light_player, dark_player, turn)
         self._roll = roll
         self._available_moves = available_moves
+        self._moves_by_source_piece = None
+        self._moves_by_source_tile = None
+        self._introducing_move = None
 
     @property
     def roll(self) -> Roll:
@@ -62,6 +83,61 @@ class WaitingForMoveGameState(PlayableGameState):
         """
         return self._available_moves
 
+    def _index_moves(self):
+        """
+        Indexes the available moves by their source piece and tile.
+        """
+        by_piece = {}
+        by_tile = {}
+        introducing_move = None
+        for move in self._available_moves:
+            source = move.source
+            if source is not None:
+                by_piece.setdefault(move.source_piece, move)
+                by_tile.setdefault(source, move)
+            elif introducing_move is None:
+                introducing_move = move
+
+        self._moves_by_source_piece = by_piece
+        self._moves_by_source_tile = by_tile
+        self._introducing_move = introducing_move
+
+    def get_move_from_piece(self, piece: Piece) -> Move | None:
+        """
+        Gets the available move that moves the given piece,
+        or None if the piece cannot be moved.
+        """
+        if self._moves_by_source_piece is None:
+            self._index_moves()
+
+        return self._moves_by_source_piece.get(piece)
+
+    def get_introducing_move(self) -> Move | None:
+        """
+        Gets the available move that introduces a new piece
+        to the board, or None if there is no such move.
+        """
+        if self._moves_by_source_tile is None:
+            self._index_moves()
+
+        return self._introducing_move
+
+    def get_move_from_tile(self, tile: Tile, paths: PathPair) -> Move | None:
+        """
+        Gets the available move that moves a piece from the given
+        tile, or None if there is no such move. The start tile of the
+        turn player's path selects the move that introduces a piece.
+        """
+        if self._moves_by_source_tile is None:
+            self._index_moves()
+
+        move = self._moves_by_source_tile.get(tile)
+        if move is None and self._introducing_move is not None \
+                and paths.get_start(self.get_turn()) == tile:
+            return self._introducing_move
+
+        return move
+
     @overrides
     def describe(self) -> str:
         turn = self.get_turn().text_name.lower()
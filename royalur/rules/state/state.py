@@ -3,12 +3,31 @@ from abc import ABC, abstractmethod
 from overrides import overrides
 
 
+KIND_OTHER = 0
+KIND_PLAYABLE = 1
+KIND_WAITING_FOR_ROLL = 2
+KIND_WAITING_FOR_MOVE = 3
+KIND_ACTION = 4
+KIND_ROLLED = 5
+KIND_MOVED = 6
+KIND_WIN = 7
+"""
+Integer tags that identify the kind of each game state class,
+so that games can classify their states without isinstance checks.
+"""
+
+
 class GameState(ABC):
     """
     A game state represents a single point within a game.
     """
     __slots__ = ("_board", "_light_player", "_dark_player")
 
+    KIND: int = KIND_OTHER
+    """
+    The kind of this game state, which is inherited by subclasses.
+    """
+
     _board: Board
     _light_player: PlayerState
     _dark_player: PlayerState
@@ -160,6 +179,8 @@ class WinGameState(GameState):
     """
     __slots__ = ("_winner",)
 
+    KIND: int = KIND_WIN
+
     _winner: PlayerType
 
     def __init__(
@@ -1,6 +1,11 @@
 import unittest
 from .test_example import TestExample
 from .test_random_games import TestRandomGames
+from .test_dice import TestDice
+from .test_board import TestBoard
+from .test_package import TestPackage
+from .test_game import TestGame
+from .test_board_encoder import TestBoardEncoder
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,282 @@
+import unittest
+from copy import deepcopy
+import pickle
+import numpy as np
+from royalur.model import (
+    Board, BoardShape, BoardType, DiceType, PathType, Piece, Move, PlayerType,
+    Tile,
+)
+
+
+class TestBoard(unittest.TestCase):
+
+    def test_piece_equality(self):
+        a = Piece(PlayerType.LIGHT, 3)
+        b = Piece(PlayerType.LIGHT, 3)
+        c = Piece(PlayerType.DARK, 3)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertRaises(ValueError, Piece, PlayerType.LIGHT, -1)
+
+    def test_tile_interning(self):
+        self.assertIs(Tile.get(2, 5), Tile.get(2, 5))
+        self.assertIs(Tile.from_indices(1, 4), Tile.get(2, 5))
+        self.assertIs(Tile.from_string("B5"), Tile.get(2, 5))
+        self.assertIs(Tile.from_string("B05"), Tile.get(2, 5))
+        self.assertIs(Tile.get(2, 5), Tile(2, 5))
+        self.assertIs(deepcopy(Tile(2, 5)), Tile(2, 5))
+        self.assertIs(pickle.loads(pickle.dumps(Tile(2, 5))), Tile(2, 5))
+        self.assertNotEqual(Tile(2, 5), Tile(5, 2))
+        self.assertNotEqual(hash(Tile(2, 5)), hash(Tile(2, 6)))
+        self.assertRaises(ValueError, Tile.get, 27, 1)
+        self.assertRaises(ValueError, Tile.get, 1, -1)
+
+    def test_tile_create_path(self):
+        path = Tile.create_path((1, 1), (3, 3), (3, 1), (3, 1))
+        self.assertEqual(
+            [str(tile) for tile in path],
+            ["A1", "B1", "B2", "C2", "C3", "C2", "C1"],
+        )
+        for tile, next_tile in zip(path, path[1:]):
+            self.assertEqual(tile.step_towards(next_tile), next_tile)
+
+    def test_path_pair_lookups(self):
+        paths = PathType.BELL.create_path_pair()
+        self.assertEqual(paths.name, "Bell")
+        self.assertIs(paths.get(PlayerType.LIGHT), paths.light)
+        self.assertIs(paths.get(PlayerType.DARK), paths.dark)
+        self.assertIs(paths.get_with_ends(PlayerType.DARK), paths.dark_with_ends)
+        self.assertEqual(paths.get_start(PlayerType.LIGHT), paths.light_start)
+        self.assertEqual(paths.get_end(PlayerType.DARK), paths.dark_end)
+        for player in (0, -1, -2, 1, 3, None, "LIGHT"):
+            self.assertRaises(ValueError, paths.get, player)
+
+    def test_board_shape_rosettes(self):
+        shape = BoardType.STANDARD.create_board_shape()
+        for ix in range(-1, shape.width + 1):
+            for iy in range(-1, shape.height + 1):
+                in_bounds = 0 <= ix < shape.width and 0 <= iy < shape.height
+                expected = in_bounds \
+                    and Tile.from_indices(ix, iy) in shape.rosettes
+                self.assertEqual(shape.is_rosette_indices(ix, iy), expected)
+
+        self.assertTrue(shape.is_rosette_indices(0, 0))
+        self.assertFalse(shape.is_rosette_indices(0, 1))
+
+    def test_model_classes_are_slotted(self):
+        shape = BoardType.STANDARD.create_board_shape()
+        instances = [
+            Tile(1, 1),
+            Piece(PlayerType.LIGHT, 1),
+            Move(
+                PlayerType.LIGHT, None, None,
+                Tile(1, 4), Piece(PlayerType.LIGHT, 0), None,
+            ),
+            PathType.BELL.create_path_pair(),
+            shape,
+            Board(shape),
+        ]
+        for instance in instances:
+            self.assertFalse(hasattr(instance, "__dict__"), type(instance).__name__)
+
+    def test_shared_path_pairs_and_shapes(self):
+        for path_type in PathType:
+            path_pair = path_type.create_path_pair()
+            self.assertIs(path_type.create_path_pair(), path_pair)
+            self.assertEqual(path_pair.name, path_type.text_name)
+        for board_type in BoardType:
+            shape = board_type.create_board_shape()
+            self.assertIs(board_type.create_board_shape(), shape)
+            self.assertEqual(shape.name, board_type.text_name)
+
+    def test_board_shape_equality(self):
+        standard = BoardType.STANDARD.create_board_shape()
+        copy = BoardShape("Standard", set(standard.tiles), list(standard.rosettes))
+        self.assertIsInstance(copy.tiles, frozenset)
+        self.assertEqual(copy, BoardShape(
+            "Standard", standard.tiles, standard.rosettes
+        ))
+        self.assertEqual(hash(copy), hash(BoardShape(
+            "Standard", standard.tiles, standard.rosettes
+        )))
+        self.assertTrue(copy.is_equivalent(standard))
+        self.assertNotEqual(copy, standard)
+
+        aseb = BoardType.ASEB.create_board_shape()
+        self.assertFalse(standard.is_equivalent(aseb))
+        self.assertFalse(standard.is_equivalent(BoardShape(
+            "Standard", standard.tiles, standard.rosettes - {Tile(1, 1)}
+        )))
+
+    def test_board_shape_contains_all(self):
+        shape = BoardType.STANDARD.create_board_shape()
+        paths = PathType.BELL.create_path_pair()
+        self.assertTrue(shape.contains_all(paths.light))
+        self.assertTrue(shape.contains_all(iter(paths.dark)))
+        self.assertTrue(shape.contains_all([]))
+        self.assertFalse(shape.contains_all(paths.light_with_ends))
+        self.assertFalse(shape.contains_all([Tile(1, 1), [1, 1]]))
+        self.assertFalse(shape.contains_all(["a", {}]))
+
+    def test_board_shape_contains_non_tiles(self):
+        shape = BoardType.STANDARD.create_board_shape()
+        for value in ("a", None, (1, 1), 4):
+            self.assertFalse(shape.contains(value))
+            self.assertFalse(shape.is_rosette(value))
+        self.assertTrue(shape.contains(Tile(1, 1)))
+        self.assertTrue(shape.is_rosette(Tile(1, 1)))
+
+    def test_other_player(self):
+        self.assertIs(PlayerType.LIGHT.get_other_player(), PlayerType.DARK)
+        self.assertIs(PlayerType.DARK.get_other_player(), PlayerType.LIGHT)
+
+    def test_player_type_str(self):
+        self.assertEqual(str(PlayerType.LIGHT), "PlayerType.LIGHT")
+        self.assertEqual(f"{PlayerType.DARK}", "PlayerType.DARK")
+
+        # Players are not interchangeable with integers or other enums.
+        self.assertNotEqual(PlayerType.LIGHT, 1)
+        self.assertNotEqual(PlayerType.LIGHT, DiceType.FOUR_BINARY)
+        self.assertIsNone({PlayerType.LIGHT: 0}.get(1))
+        self.assertEqual([player.index for player in PlayerType], [1, 2])
+
+    def test_move_equality(self):
+        source = Tile(1, 4)
+        dest = Tile(2, 1)
+        a = Move(
+            PlayerType.LIGHT, source, Piece(PlayerType.LIGHT, 0),
+            dest, Piece(PlayerType.LIGHT, 2), None
+        )
+        b = Move(
+            PlayerType.LIGHT, source, Piece(PlayerType.LIGHT, 0),
+            dest, Piece(PlayerType.LIGHT, 2), None
+        )
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+
+    def test_move_validation(self):
+        tile = Tile(1, 4)
+        piece = Piece(PlayerType.LIGHT, 0)
+        light = PlayerType.LIGHT
+        self.assertRaises(ValueError, Move, light, tile, None, None, None, None)
+        self.assertRaises(ValueError, Move, light, None, None, tile, None, None)
+        self.assertRaises(
+            ValueError, Move, light, tile, piece, None, None, piece
+        )
+        Move(light, tile, piece, None, None, None)
+
+    def test_piece_pack(self):
+        for owner in PlayerType:
+            for path_index in (0, 1, 13, 63):
+                piece = Piece(owner, path_index)
+                packed = piece.pack()
+                self.assertNotEqual(packed, 0)
+                self.assertLess(packed, 256)
+                self.assertEqual(Piece.unpack(packed), piece)
+
+        self.assertIsNone(Piece.unpack(0))
+        # Boards pack their pieces, so pieces must fit in a byte.
+        self.assertRaises(ValueError, Piece, PlayerType.LIGHT, 64)
+        self.assertRaises(ValueError, Piece, PlayerType.DARK, -1)
+
+    def test_board_to_bytes(self):
+        board = Board(BoardType.STANDARD.create_board_shape())
+        self.assertEqual(board.to_bytes(), bytes(24))
+
+        piece = Piece(PlayerType.DARK, 4)
+        board.set(Tile(3, 1), piece)
+        packed = board.to_bytes()
+        self.assertEqual(len(packed), 24)
+        self.assertEqual(sum(1 for b in packed if b != 0), 1)
+        self.assertIn(piece.pack(), packed)
+
+        # The packed pieces are kept up to date as the board changes.
+        board.set(Tile(1, 4), Piece(PlayerType.LIGHT, 4))
+        board.set(Tile(3, 1), None)
+        for copy in (board, board.copy(), board.copy(invert=True)):
+            self.assertEqual(copy.to_bytes(), bytes(
+                0 if piece is None else piece.pack()
+                for piece in copy.pieces
+            ))
+
+        board.clear()
+        self.assertEqual(board.to_bytes(), bytes(24))
+
+    def test_board_pieces(self):
+        board = Board(BoardType.STANDARD.create_board_shape())
+        self.assertEqual(board.pieces, [None] * 24)
+
+        piece = Piece(PlayerType.LIGHT, 4)
+        board.set(Tile(1, 4), piece)
+        self.assertIs(board.pieces[3 * board.width], piece)
+        self.assertIs(board.get(Tile(1, 4)), piece)
+
+    def test_board_hash(self):
+        shape = BoardType.STANDARD.create_board_shape()
+        board = Board(shape)
+        self.assertRaises(TypeError, hash, board)
+        empty_hash = board.zobrist_hash
+
+        board.set(Tile(1, 4), Piece(PlayerType.LIGHT, 0))
+        board.set(Tile(3, 2), Piece(PlayerType.DARK, 2))
+        self.assertNotEqual(board.zobrist_hash, empty_hash)
+
+        other = Board(shape)
+        other.set(Tile(3, 2), Piece(PlayerType.DARK, 2))
+        other.set(Tile(1, 4), Piece(PlayerType.LIGHT, 0))
+        self.assertEqual(board, other)
+        self.assertEqual(board.zobrist_hash, other.zobrist_hash)
+        self.assertEqual(board.copy().zobrist_hash, board.zobrist_hash)
+
+        board.set(Tile(1, 4), None)
+        board.set(Tile(3, 2), None)
+        self.assertEqual(board.zobrist_hash, empty_hash)
+
+        other.clear()
+        self.assertEqual(other.zobrist_hash, empty_hash)
+
+        inverted = Board(shape)
+        inverted.set(Tile(3, 4), Piece(PlayerType.DARK, 0))
+        source = Board(shape)
+        source.set(Tile(1, 4), Piece(PlayerType.LIGHT, 0))
+        self.assertEqual(source.copy(invert=True).zobrist_hash, inverted.zobrist_hash)
+
+    def test_move_describe(self):
+        light = PlayerType.LIGHT
+        source = Tile(1, 1)
+        dest = Tile(2, 1)
+        piece = Piece(light, 3)
+        moved = Piece(light, 4)
+        captured = Piece(PlayerType.DARK, 4)
+
+        move = Move(light, None, None, dest, moved, None)
+        self.assertEqual(move.describe(), "Introduce a piece to B1")
+        move = Move(light, None, None, dest, moved, captured)
+        self.assertEqual(move.describe(), "Introduce a piece to capture B1")
+        move = Move(light, source, piece, dest, moved, None)
+        self.assertEqual(move.describe(), "Move A1 to B1")
+        self.assertIs(move.describe(), move.describe())
+        move = Move(light, source, piece, dest, moved, captured)
+        self.assertEqual(move.describe(), "Move A1 to capture B1")
+        move = Move(light, source, piece, None, None, None)
+        self.assertEqual(move.describe(), "Score a piece from A1")
+        move = Move(light, None, None, None, None, None)
+        self.assertEqual(move.describe(), "Introduce and score a piece")
+
+    def test_board_hash_batch(self):
+        shape = BoardType.ASEB.create_board_shape()
+        boards = [Board(shape) for _ in range(3)]
+        boards[1].set(Tile(1, 1), Piece(PlayerType.LIGHT, 3))
+        boards[2].set(Tile(2, 5), Piece(PlayerType.DARK, 7))
+        boards[2].set(Tile(3, 4), Piece(PlayerType.DARK, 1))
+
+        packed = np.array([
+            np.frombuffer(board.to_bytes(), dtype=np.uint8)
+            for board in boards
+        ])
+        hashes = Board.hash_batch(packed)
+        self.assertEqual(
+            hashes.tolist(), [board.zobrist_hash for board in boards]
+        )
@@ -0,0 +1,75 @@
+import unittest
+import random
+import numpy as np
+from royalur import Game, PlayerType
+from royalur.lut.board_encoder import SimpleGameStateEncoding
+
+
+def _encode_reference(encoding: SimpleGameStateEncoding, state) -> int:
+    board = state.board
+
+    middle = 0
+    for iy in range(8):
+        piece = board.get_by_indices(1, iy)
+        if piece is not None:
+            occupant = 1 if piece.owner == PlayerType.DARK else 2
+            middle |= occupant << (2 * iy)
+
+    def side(ix: int) -> int:
+        lane = 0
+        for bit, iy in enumerate((0, 1, 2, 3, 6, 7)):
+            if board.get_by_indices(ix, iy) is not None:
+                lane |= 1 << bit
+        return lane
+
+    return side(2) \
+        | (encoding.middle_lane_compression[middle] << 6) \
+        | (side(0) << 19) \
+        | (state.dark_player.piece_count << 25) \
+        | (state.light_player.piece_count << 28)
+
+
+class TestBoardEncoder(unittest.TestCase):
+
+    def _light_states(self, count: int):
+        random.seed(7)
+        states = []
+        while len(states) < count:
+            game = Game.create_finkel()
+            while not game.is_finished() and len(states) < count:
+                if game.is_waiting_for_roll():
+                    state = game.get_current_state()
+                    if state.get_turn() == PlayerType.LIGHT:
+                        states.append(state)
+                    game.roll_dice()
+                else:
+                    game.make_move(random.choice(game.find_available_moves()))
+        return states
+
+    def test_encode_game_state(self):
+        encoding = SimpleGameStateEncoding()
+        for state in self._light_states(200):
+            self.assertEqual(
+                encoding.encode_game_state(state),
+                _encode_reference(encoding, state)
+            )
+
+    def test_encode_boards(self):
+        encoding = SimpleGameStateEncoding()
+        boards = [state.board for state in self._light_states(200)]
+        packed = np.array(
+            [list(board.to_bytes()) for board in boards], dtype=np.uint8
+        )
+        encoded = encoding.encode_boards(packed)
+        self.assertEqual(encoded.dtype, np.uint32)
+        self.assertEqual(
+            encoded.tolist(),
+            [encoding.encode_board(board) for board in boards]
+        )
+        self.assertRaises(ValueError, encoding.encode_boards, packed[:, :21])
+
+    def test_rejects_dark_turn(self):
+        encoding = SimpleGameStateEncoding()
+        game = Game.create_finkel()
+        state = game.get_current_state().copy_inverted()
+        self.assertRaises(ValueError, encoding.encode_game_state, state)
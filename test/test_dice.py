@@ -0,0 +1,103 @@
+import random
+import unittest
+import numpy as np
+from royalur.model import BinaryDice, BinaryDice0AsMax, DiceType
+
+
+class TestDice(unittest.TestCase):
+
+    def test_binary_roll_values(self):
+        dice = BinaryDice("Test", 4)
+        seen = set()
+        for _ in range(1000):
+            value = dice.roll_value()
+            self.assertGreaterEqual(value, 0)
+            self.assertLessEqual(value, 4)
+            seen.add(value)
+
+        self.assertEqual(seen, {0, 1, 2, 3, 4})
+
+    def test_binary_0_as_max_roll_values(self):
+        dice = BinaryDice0AsMax("Test", 3)
+        seen = set()
+        for _ in range(1000):
+            value = dice.roll_value()
+            self.assertGreaterEqual(value, 1)
+            self.assertLessEqual(value, 4)
+            seen.add(value)
+
+        self.assertEqual(seen, {1, 2, 3, 4})
+        self.assertEqual(dice.get_max_roll_value(), 4)
+
+    def test_dice_types(self):
+        for dice_type in DiceType:
+            dice = dice_type.create_dice()
+            max_roll = dice.get_max_roll_value()
+            self.assertEqual(dice.roll(max_roll).value, max_roll)
+            self.assertAlmostEqual(sum(dice.get_roll_probabilities()), 1.0)
+
+    def test_dice_type_str(self):
+        self.assertEqual(str(DiceType.FOUR_BINARY), "DiceType.FOUR_BINARY")
+        self.assertEqual(f"{DiceType.THREE_BINARY_0MAX}", "DiceType.THREE_BINARY_0MAX")
+
+    def test_roll_values_batch(self):
+        dice = BinaryDice("Test", 4)
+        values = dice.roll_values_batch(1000)
+        self.assertEqual(len(values), 1000)
+        self.assertEqual(set(values.tolist()), {0, 1, 2, 3, 4})
+
+        dice = BinaryDice0AsMax("Test", 3)
+        values = dice.roll_values_batch(1000)
+        self.assertEqual(len(values), 1000)
+        self.assertEqual(set(values.tolist()), {1, 2, 3, 4})
+
+    def test_roll_values_batch_is_deterministic(self):
+        for create_dice in (
+                lambda: BinaryDice("Test", 4),
+                lambda: BinaryDice0AsMax("Test", 3),
+        ):
+            random.seed(1234)
+            dice = create_dice()
+            first = [dice.roll_values_batch(100).tolist() for _ in range(3)]
+            random.seed(1234)
+            dice = create_dice()
+            second = [dice.roll_values_batch(100).tolist() for _ in range(3)]
+            self.assertEqual(first, second)
+            self.assertNotEqual(first[0], first[1])
+
+            first = dice.roll_values_batch(100, np.random.default_rng(5))
+            second = dice.roll_values_batch(100, np.random.default_rng(5))
+            self.assertEqual(first.tolist(), second.tolist())
+
+    def test_sample_roll_value_cdf(self):
+        for num_die in (3, 4, 8):
+            dice = BinaryDice("Test", num_die)
+            seen = {dice.sample_roll_value_cdf() for _ in range(5000)}
+            self.assertEqual(seen, set(range(num_die + 1)))
+
+        dice = BinaryDice0AsMax("Test", 3)
+        seen = {dice.sample_roll_value_cdf() for _ in range(1000)}
+        self.assertEqual(seen, {1, 2, 3, 4})
+
+    def test_generate_roll(self):
+        dice = BinaryDice("Test", 4)
+        for value in range(5):
+            self.assertEqual(dice.generate_roll(value).value, value)
+            self.assertIs(dice.generate_roll(value), dice.roll(value))
+        self.assertRaises(ValueError, dice.generate_roll, -1)
+        self.assertRaises(ValueError, dice.generate_roll, 5)
+
+        dice = BinaryDice0AsMax("Test", 3)
+        for value in range(1, 5):
+            self.assertEqual(dice.generate_roll(value).value, value)
+        self.assertRaises(ValueError, dice.generate_roll, 0)
+        self.assertRaises(ValueError, dice.generate_roll, 5)
+
+    def test_many_die_roll_values(self):
+        dice = BinaryDice("Test", 12)
+        for _ in range(100):
+            self.assertIn(dice.roll_value(), range(13))
+
+        dice = BinaryDice0AsMax("Test", 12)
+        for _ in range(100):
+            self.assertIn(dice.roll_value(), range(1, 14))
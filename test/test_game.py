@@ -0,0 +1,199 @@
+import unittest
+import random
+from royalur import Game, GameSettings
+from royalur.rules import (
+    WaitingForRollGameState,
+    WaitingForMoveGameState,
+    RolledGameState,
+    MovedGameState,
+    WinGameState,
+)
+
+
+class TestGame(unittest.TestCase):
+
+    def _roll_until_moves(self, game: Game):
+        while not game.is_waiting_for_move():
+            game.roll_dice()
+
+    def test_state_predicates(self):
+        game = Game.create_finkel()
+        self.assertTrue(game.is_playable())
+        self.assertTrue(game.is_waiting_for_roll())
+        self.assertFalse(game.is_waiting_for_move())
+        self.assertFalse(game.is_finished())
+        self.assertIsInstance(
+            game.get_current_waiting_for_roll_state(),
+            WaitingForRollGameState
+        )
+        self.assertRaises(RuntimeError, game.get_current_waiting_for_move_state)
+        self.assertRaises(RuntimeError, game.get_current_win_state)
+
+        self._roll_until_moves(game)
+        self.assertTrue(game.is_playable())
+        self.assertFalse(game.is_waiting_for_roll())
+        self.assertIsInstance(
+            game.get_current_waiting_for_move_state(),
+            WaitingForMoveGameState
+        )
+        self.assertRaises(RuntimeError, game.get_current_waiting_for_roll_state)
+
+    def test_finished_game(self):
+        game = Game.create_finkel(pawns=1)
+        while not game.is_finished():
+            if game.is_waiting_for_roll():
+                game.roll_dice()
+            else:
+                game.make_move(game.find_available_moves()[0])
+
+        self.assertFalse(game.is_playable())
+        self.assertIsInstance(game.get_current_win_state(), WinGameState)
+        self.assertEqual(game.get_turn_or_winner(), game.get_winner())
+        self.assertRaises(RuntimeError, game.get_current_playable_state)
+        self.assertRaises(RuntimeError, game.get_turn)
+
+    def test_presets_share_rules(self):
+        game = Game.create_finkel()
+        other = Game.create_finkel()
+        self.assertIs(game.rules, other.rules)
+        self.assertIsNot(game.dice, other.dice)
+        self.assertIsNot(Game.create_finkel(5).rules, game.rules)
+        self.assertEqual(
+            Game.create_finkel(5).rules.settings.starting_piece_count, 5
+        )
+        self.assertFalse(Game.create_masters().rules.are_rosettes_safe())
+        self.assertEqual(
+            Game.create_aseb().rules.settings.starting_piece_count, 5
+        )
+
+    def test_builder(self):
+        builder = Game.builder()
+        custom = builder.masters() \
+            .starting_piece_count(4) \
+            .safe_rosettes(True) \
+            .captures_grant_extra_rolls(True)
+
+        settings = custom.settings
+        self.assertIs(custom.settings, settings)
+        self.assertEqual(settings.starting_piece_count, 4)
+        self.assertTrue(settings.safe_rosettes)
+        self.assertTrue(settings.rosettes_grant_extra_rolls)
+        self.assertTrue(settings.captures_grant_extra_rolls)
+        self.assertEqual(settings.paths, GameSettings.create_masters().paths)
+
+        # Builders are not modified by building on them.
+        self.assertEqual(builder.settings.starting_piece_count, 7)
+        self.assertFalse(builder.settings.captures_grant_extra_rolls)
+        self.assertRaises(ValueError, builder.starting_piece_count, 0)
+
+        game = custom.build()
+        self.assertEqual(game.get_light_player().piece_count, 4)
+        self.assertTrue(game.rules.do_captures_grant_extra_rolls())
+
+    def test_make_move_from_piece_or_tile(self):
+        game = Game.create_finkel()
+        self._roll_until_moves(game)
+        state = game.get_current_waiting_for_move_state()
+        self.assertTrue(state.get_introducing_move().is_introducing_piece())
+
+        end = game.rules.paths.get_end(game.get_turn())
+        self.assertRaises(ValueError, game.make_move, end)
+
+        move = game.find_available_moves()[0]
+        game.make_move(move.get_source(game.rules.paths))
+        self.assertIsInstance(game.get_action_states()[-1], MovedGameState)
+        self.assertEqual(game.get_action_states()[-1].move, move)
+
+        while True:
+            self._roll_until_moves(game)
+            moves = [
+                move for move in game.find_available_moves()
+                if move.has_source()
+            ]
+            if len(moves) > 0:
+                break
+            game.make_move(game.find_available_moves()[0])
+
+        move = moves[0]
+        game.make_move(move.get_source_piece())
+        self.assertEqual(game.get_action_states()[-1].move, move)
+
+    def test_add_states(self):
+        game = Game.create_finkel()
+        self.assertRaises(ValueError, game.add_states, [])
+        self.assertRaises(ValueError, game.add_states, iter(()))
+
+        other = Game.create_finkel()
+        self._roll_until_moves(other)
+        game.add_states(state for state in other.states[1:])
+        self.assertEqual(game.states[1:], other.states[1:])
+        self.assertTrue(game.is_waiting_for_move())
+        self.assertEqual(game.get_action_states(), other.get_action_states())
+
+    def test_copy(self):
+        game = Game.create_finkel()
+        self._roll_until_moves(game)
+        copy = game.copy()
+        self.assertEqual(copy.states, game.states)
+        self.assertEqual(copy.get_action_states(), game.get_action_states())
+        self.assertTrue(copy.is_waiting_for_move())
+
+        copy.make_move(copy.find_available_moves()[0])
+        self.assertTrue(game.is_waiting_for_move())
+        self.assertEqual(len(copy.states), len(game.states) + 2)
+        self.assertEqual(
+            len(copy.get_landmark_states()),
+            len(game.get_landmark_states()) + 1
+        )
+
+    def test_add_state_override(self):
+        class RecordingGame(Game):
+            __slots__ = ("added",)
+
+            def add_state(self, state):
+                if not hasattr(self, "added"):
+                    self.added = []
+                self.added.append(state)
+                super().add_state(state)
+
+        game = RecordingGame(Game.create_finkel().rules)
+        self._roll_until_moves(game)
+        self.assertEqual(game.added, list(game.states))
+
+    def test_rollout(self):
+        game = Game.create_finkel()
+        winner = game.rollout(
+            lambda state: random.choice(state.available_moves)
+        )
+        self.assertTrue(game.is_finished())
+        self.assertEqual(winner, game.get_winner())
+
+        game = Game.create_aseb()
+        self._roll_until_moves(game)
+        game.rollout(lambda state: state.available_moves[0])
+        self.assertTrue(game.is_finished())
+
+    def test_history(self):
+        game = Game.create_finkel()
+        for _ in range(50):
+            if game.is_finished():
+                break
+            if game.is_waiting_for_roll():
+                game.roll_dice()
+            else:
+                game.make_move(game.find_available_moves()[0])
+
+        states = game.states
+        self.assertIs(game.states, states)
+        action_states = game.get_action_states()
+        self.assertEqual(action_states, [
+            state for state in states
+            if isinstance(state, (RolledGameState, MovedGameState))
+        ])
+
+        landmark_states = game.get_landmark_states()
+        self.assertIs(landmark_states[-1], states[-1])
+        self.assertEqual(landmark_states[:-1], [
+            state for state in states[:-1]
+            if isinstance(state, MovedGameState)
+        ])
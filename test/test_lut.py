@@ -1,15 +1,88 @@
 import unittest
+import copy
+import json
+import os
+import tempfile
 from royalur import LutReader
 from royalur.game import Game
 import random
+from royalur.lut.board_encoder import SimpleGameStateEncoding
 from royalur.lut.lut_player import LutAgent
 from royalur.model.player import PlayerType
+from royalur.rules.state import KIND_WAITING_FOR_ROLL, KIND_WIN
 from huggingface_hub import hf_hub_download
 
 REPO_ID = "sothatsit/RoyalUr"
 FILENAME = "finkel2p.rgu"
 
 
+def write_lut_file(path: str, maps: list[dict[int, int]]):
+    """
+    Writes a look-up table file containing the given maps of keys to values.
+    """
+    header = json.dumps({"author": "Test"}).encode("utf-8")
+    contents = bytearray(b"RGU\x00")
+    contents += len(header).to_bytes(4, "big")
+    contents += header
+    contents += len(maps).to_bytes(4, "big")
+    for lut_map in maps:
+        contents += len(lut_map).to_bytes(4, "big")
+    for lut_map in maps:
+        for key in sorted(lut_map):
+            contents += key.to_bytes(4, "big")
+    for lut_map in maps:
+        for key in sorted(lut_map):
+            contents += lut_map[key].to_bytes(2, "big")
+
+    with open(path, "wb") as file:
+        file.write(contents)
+
+
+def encode_as_light(encoding: SimpleGameStateEncoding, state) -> int:
+    """
+    Encodes the given state, inverting it if it is the dark player's turn.
+    """
+    if state.get_turn() != PlayerType.LIGHT:
+        state = state.copy_inverted()
+    return encoding.encode_game_state(state)
+
+
+def find_light_state_keys(rules) -> set[int]:
+    """
+    Finds the encodings of every reachable state of the given rules,
+    with the states where it is the dark player's turn inverted.
+    """
+    dice = rules.dice_factory()
+    encoding = SimpleGameStateEncoding()
+
+    def encode(state):
+        return encode_as_light(encoding, state)
+
+    start = rules.generate_initial_game_state()
+    keys = {encode(start)}
+    to_visit = [start]
+    while len(to_visit) > 0:
+        state = to_visit.pop()
+        for value in range(dice.get_max_roll_value() + 1):
+            rolled = rules.apply_roll(state, dice.generate_roll(value))[-1]
+            if rolled.KIND == KIND_WAITING_FOR_ROLL:
+                next_states = [rolled]
+            else:
+                next_states = [
+                    rules.apply_move(rolled, move)[-1]
+                    for move in rolled.available_moves
+                ]
+
+            for next_state in next_states:
+                if next_state.KIND == KIND_WIN:
+                    continue
+                key = encode(next_state)
+                if key not in keys:
+                    keys.add(key)
+                    to_visit.append(next_state)
+    return keys
+
+
 class TestLut(unittest.TestCase):
 
     def test_lut_read(self):
@@ -38,6 +111,189 @@ class TestLut(unittest.TestCase):
         for key, value in expected_dict_values.items():
             self.assertEqual(lut.lookup(0, key), value)
 
+    def read_test_lut(self, maps: list[dict[int, int]]):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.rgu")
+            write_lut_file(path, maps)
+            return LutReader(path).read()
+
+    def test_lut_header(self):
+        lut = self.read_test_lut([{1: 2}])
+        self.assertEqual(lut.decoded_header["author"], "Test")
+        self.assertEqual(lut.get_metadata()["decoded_header"]["author"], "Test")
+        self.assertEqual(json.loads(lut.get_metadata()["raw_header"])["author"], "Test")
+        self.assertEqual(lut.get_metadata()["size_of_lut_file_bytes"], 6)
+        self.assertEqual(lut.get_metadata()["size_of_lut_python_bytes"], 6)
+        self.assertEqual(lut.get_metadata()["size_ratio"], 1.0)
+
+    def test_lut_does_not_hold_file(self):
+        entries = {key * 3: key for key in range(50)}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.rgu")
+            write_lut_file(path, [entries])
+            lut = LutReader(path).read()
+
+            # The file may be changed once it has been read.
+            with open(path, "wb"):
+                pass
+
+            self.assertEqual(lut.lookup(0, 9), 3)
+            self.assertEqual(lut.keys_as_numpy(0).tolist(), sorted(entries))
+            self.assertEqual(lut.values_as_numpy(0).tolist(), list(range(50)))
+
+    def test_lut_equality(self):
+        entries = {key * 3: key for key in range(50)}
+        lut = self.read_test_lut([entries])
+        same = self.read_test_lut([entries])
+        different = self.read_test_lut([{**entries, 1: 1}])
+
+        self.assertEqual(lut, same)
+        self.assertEqual(hash(lut), hash(same))
+        self.assertNotEqual(lut, different)
+        self.assertEqual(copy.copy(lut), lut)
+
+        # Tables that differ in their values or interior keys hash differently.
+        other_values = {**entries, 30: 1}
+        other_keys = {**entries, 31: entries[30]}
+        del other_keys[30]
+        for other in (other_values, other_keys):
+            self.assertNotEqual(hash(self.read_test_lut([other])), hash(lut))
+        empty = self.read_test_lut([{}])
+        self.assertEqual(hash(empty), hash(self.read_test_lut([{}])))
+
+        self.assertIn(6, lut)
+        self.assertNotIn(7, lut)
+        self.assertIn(1, different)
+
+    def test_lut_lookup_batch(self):
+        entries = {key * 7 + 3: (key * 31) % 65536 for key in range(500)}
+        lut = self.read_test_lut([entries])
+
+        keys = [10, 3, 3496, 3 + 7 * 250]
+        values = lut.lookup_batch(0, keys)
+        self.assertEqual(values.tolist(), [entries[key] for key in keys])
+        self.assertEqual(values.tolist(), [lut.lookup(0, key) for key in keys])
+        self.assertEqual(len(lut.lookup_batch(0, [])), 0)
+        self.assertRaises(KeyError, lut.lookup_batch, 0, [3, 4])
+        self.assertRaises(KeyError, lut.lookup_batch, 0, [1 << 30])
+
+        values = lut.lookup_batch(0, [3, 4, 1 << 30, 10], missing_value=-1)
+        self.assertEqual(values.tolist(), [entries[3], -1, -1, entries[10]])
+        self.assertEqual(len(lut.lookup_batch(0, [], missing_value=-1)), 0)
+
+    def test_lut_lookup_batch_out_of_range_keys(self):
+        # Keys outside the range of the key type must not wrap around
+        # to the keys of other states.
+        lut = self.read_test_lut([{0: 5, (1 << 32) - 1: 6}])
+        self.assertRaises(KeyError, lut.lookup_batch, 0, [-1])
+        self.assertRaises(KeyError, lut.lookup_batch, 0, [1 << 32])
+        self.assertRaises(KeyError, lut.lookup_batch, 0, [0, (1 << 32) + 5])
+
+        values = lut.lookup_batch(0, [-1, 1 << 32, 0, (1 << 32) - 1], missing_value=-1)
+        self.assertEqual(values.tolist(), [-1, -1, 5, 6])
+        self.assertRaises(KeyError, lut.lookup, 0, -1)
+        self.assertRaises(KeyError, lut.lookup, 0, 1 << 32)
+
+    def test_lut_lookup(self):
+        first = {key * 5 + 1: key for key in range(100)}
+        second = {key * 3: 1000 + key for key in range(40)}
+        lut = self.read_test_lut([first, second])
+
+        for key, value in first.items():
+            self.assertEqual(lut.lookup(0, key), value)
+        for key, value in second.items():
+            self.assertEqual(lut.lookup(1, key), value)
+
+        self.assertRaises(KeyError, lut.lookup, 0, 2)
+        self.assertRaises(KeyError, lut.lookup, 1, 1)
+        self.assertRaises(KeyError, lut.lookup, 0, -1)
+        self.assertRaises(KeyError, lut.lookup, 0, (1 << 32) + 1)
+
+        details = lut.lookup_detailed(1, 9)
+        self.assertEqual(details["index_of_key"], 3)
+        self.assertEqual(details["key_lookup_details"]["value"], 9)
+        self.assertEqual(details["value_lookup_details"]["value"], 1003)
+
+        # The steps are those taken by the search, rather than a bound.
+        steps = [
+            lut.lookup_detailed(0, key)["key_binary_search_steps"] for key in first
+        ]
+        self.assertEqual(min(steps), 0)
+        self.assertGreater(max(steps), 0)
+        self.assertLess(max(steps), len(first).bit_length())
+        single = self.read_test_lut([{5: 6}])
+        self.assertEqual(single.lookup_detailed(0, 5)["key_binary_search_steps"], 0)
+
+    def test_lut_lookup_sparse_keys(self):
+        rand = random.Random(42)
+        entries = {rand.randrange(1 << 32): rand.randrange(1 << 16) for _ in range(300)}
+        entries[0] = 1
+        entries[(1 << 32) - 1] = 2
+        lut = self.read_test_lut([{}, entries])
+
+        for key, value in entries.items():
+            self.assertEqual(lut.lookup(1, key), value)
+        for _ in range(300):
+            key = rand.randrange(1 << 32)
+            if key not in entries:
+                self.assertRaises(KeyError, lut.lookup, 1, key)
+        self.assertRaises(KeyError, lut.lookup, 0, 0)
+
+    def test_lut_agent_decisions(self):
+        # One agent plays games under two sets of rules that share
+        # positions, but not always the best moves from them.
+        rule_sets = [
+            Game.create_finkel(pawns=1).rules,
+            Game.builder().finkel().starting_piece_count(1)
+            .rosettes_grant_extra_rolls(False).build_rules(),
+        ]
+        keys = set()
+        for rules in rule_sets:
+            keys |= find_light_state_keys(rules)
+        values = {key: (key * 40503) % 65536 for key in keys}
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.rgu")
+            write_lut_file(path, [values])
+            agent = LutAgent(path)
+
+        encoding = SimpleGameStateEncoding()
+
+        def expected_move(state, rules):
+            # Both players choose the move with the highest value
+            # for the light player.
+            highest_value = 0
+            highest_move = None
+            for move in state.available_moves:
+                next_state = rules.apply_move(state, move)[-1]
+                if next_state.KIND == KIND_WIN:
+                    light_won = next_state.get_winner() == PlayerType.LIGHT
+                    value = 65535 if light_won else 0
+                else:
+                    value = values[encode_as_light(encoding, next_state)]
+                    if next_state.get_turn() != PlayerType.LIGHT:
+                        value = 65535 - value
+                if value > highest_value:
+                    highest_value = value
+                    highest_move = move
+            return highest_move
+
+        rand = random.Random(42)
+        for game_index in range(40):
+            rules = rule_sets[game_index % 2]
+            game = Game(rules)
+            while not game.is_finished():
+                if game.is_waiting_for_roll():
+                    game.roll_dice(rand.randint(0, 4))
+                    continue
+
+                state = game.get_current_waiting_for_move_state()
+                move = agent.play(game)
+                self.assertIs(move, expected_move(state, rules))
+                game.make_move(move if move is not None else rand.choice(
+                    game.find_available_moves()
+                ))
+
     def test_lut_plays_against_random_and_wins(self):
         random.seed(99_999_999)
         filename = hf_hub_download(repo_id=REPO_ID, filename=FILENAME)
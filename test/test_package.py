@@ -0,0 +1,24 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestPackage(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        code = (
+            "import sys, royalur\n"
+            "assert 'royalur.rules' not in sys.modules\n"
+            "assert 'royalur.game' not in sys.modules\n"
+            "assert 'royalur.lut' not in sys.modules\n"
+            "from royalur import Game\n"
+            "assert 'royalur.game' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_exports(self):
+        import royalur
+        for name in royalur.__all__:
+            self.assertIsNotNone(getattr(royalur, name))
+
+        self.assertRaises(AttributeError, getattr, royalur, "Missing")